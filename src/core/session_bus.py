@@ -0,0 +1,37 @@
+"""Shared session-bus connection for the plugins that talk D-Bus.
+
+connection() opens one session-bus connection on first use and returns it to every
+caller. Calls that wait for a reply pass timeout=TIMEOUT. Callers catch ERRORS and
+then call drop(), so the next call opens a fresh connection.
+"""
+
+from jeepney import AuthenticationError
+from jeepney.io.blocking import open_dbus_connection
+
+# Cap on every call that waits for a reply, so a wedged bus or service can't hang
+# the voice loop.
+TIMEOUT = 5.0
+
+# What reaching the bus can raise. KeyError: no DBUS_SESSION_BUS_ADDRESS, so there
+# is no session bus to try (e.g. a headless host such as WSL). TimeoutError: no
+# reply within TIMEOUT. AuthenticationError: the bus refused us.
+ERRORS = (KeyError, TimeoutError, OSError, AuthenticationError)
+
+# Opened on first use.
+_bus = None
+
+
+def connection():
+    """Return the shared session-bus connection, opening it on first use."""
+    global _bus
+    if _bus is None:
+        _bus = open_dbus_connection(bus="SESSION")
+    return _bus
+
+
+def drop():
+    """Forget a connection that failed, so the next call opens a fresh one."""
+    global _bus
+    if _bus is not None:
+        _bus.close()
+        _bus = None
@@ -9,7 +9,11 @@ Features:
 import atexit
 import logging
 import re
-import subprocess
+import time
+from pathlib import Path
+
+from easyspeak.core import session_bus
+from jeepney import DBusAddress, MessageType, new_method_call
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +42,40 @@ drag_start = None
 
 NUDGE_AMOUNT = 20
 
+# (column, row) of each zone in the 3x3 grid, numbered like a phone keypad.
+ZONE_CELLS = {
+    1: (0, 0),
+    2: (1, 0),
+    3: (2, 0),  # top row
+    4: (0, 1),
+    5: (1, 1),
+    6: (2, 1),  # middle row
+    7: (0, 2),
+    8: (1, 2),
+    9: (2, 2),  # bottom row
+}
+
+# How long a looked-up screen size is trusted. Reopening the grid in quick
+# succession reuses it instead of asking GNOME Shell again; a resolution or
+# monitor change is still picked up by the first grid opened after it expires.
+SCREEN_SIZE_TTL = 30.0
+DEFAULT_SCREEN_SIZE = (1920, 1080)
+
+# Where to read a screen size when the extension can't answer: sysfs mode lists,
+# preferred mode first, of the usual laptop and desktop connectors.
+DRM_DIR = Path("/sys/class/drm")
+DRM_CONNECTORS = (
+    "card0-eDP-1",
+    "card1-eDP-1",
+    "card0-DP-1",
+    "card1-DP-1",
+    "card0-HDMI-A-1",
+    "card1-HDMI-A-1",
+)
+
+# (size, time.monotonic() when it was looked up), or None before the first lookup.
+_screen_size_cache = None
+
 # Trigger words
 GRID_TRIGGERS = {
     "grid",
@@ -64,6 +102,9 @@ GRID_TRIGGERS = {
     "crosshair",
 }
 
+# Words that close grid mode, matched anywhere in the utterance.
+EXIT_WORDS = {"close", "cancel", "escape", "exit", "hide", "stop", "done", "quit"}
+
 # Number parsing - word to digit
 WORD_TO_NUM = {
     "one": 1,
@@ -89,6 +130,9 @@ WORD_TO_NUM = {
     "nein": 9,
 }
 
+# Any of the number words above, as a whole word, in one pass.
+NUMBER_WORD = re.compile(rf"\b({'|'.join(WORD_TO_NUM)})\b")
+
 DIRECTIONS = {
     "up": ["up", "north", "top", "upper", "above"],
     "down": ["down", "south", "bottom", "lower", "below"],
@@ -99,6 +143,26 @@ DIRECTIONS = {
 
 # This plugin drives the GNOME Shell extension over D-Bus (see dbus_call); core
 # owns installing, refreshing, and enabling it (easyspeak.core.gnome_extension).
+DESKTOP = DBusAddress(
+    "/org/easyspeak/Desktop",
+    bus_name="org.gnome.Shell",
+    interface="org.easyspeak.Desktop",
+)
+
+# D-Bus signature of each extension method the grid calls (see extension.js).
+SIGNATURES = {
+    "Show": "ii",
+    "Hide": "",
+    "Update": "iiii",
+    "Click": "ii",
+    "DoubleClick": "ii",
+    "RightClick": "ii",
+    "MiddleClick": "ii",
+    "StartDrag": "ii",
+    "EndDrag": "ii",
+    "Scroll": "iisi",
+    "GetScreenSize": "",
+}
 
 
 def setup(c):
@@ -107,79 +171,66 @@ def setup(c):
     core = c
 
 
-def host_run(cmd):
-    """Run a command and capture its output (the plugin's own subprocess seam).
+def _desktop_call(method, *args):
+    """Call a method on the grid extension; its reply body, or None on failure.
 
-    A missing executable returns a failed result (returncode 1) rather than
-    raising, so callers treat an absent `gdbus`—e.g. on a headless host such as
-    WSL with no GNOME session—as a plain D-Bus failure. Without this the atexit
-    cleanup would raise FileNotFoundError on exit.
+    No session bus (e.g. a headless host such as WSL) or no extension on it is a
+    plain failure rather than an exception, so the atexit cleanup can't raise on
+    exit.
     """
+    message = new_method_call(DESKTOP, method, SIGNATURES[method], args)
     try:
-        return subprocess.run(cmd, capture_output=True, text=True)
-    except FileNotFoundError as exc:
-        logger.debug("Command not found: %s", exc)
-        return subprocess.CompletedProcess(
-            cmd, returncode=1, stdout="", stderr=str(exc)
+        reply = session_bus.connection().send_and_get_reply(
+            message, timeout=session_bus.TIMEOUT
         )
+    except session_bus.ERRORS as exc:
+        logger.debug("D-Bus call %s failed: %s", method, exc)
+        session_bus.drop()
+        return None
+    if reply.header.message_type is MessageType.error:
+        logger.debug("D-Bus call %s failed: %s", method, reply.body)
+        return None
+    return reply.body
 
 
 def dbus_call(method, *args):
     """Call a method on the grid extension over D-Bus; True on success."""
-    cmd = [
-        "gdbus",
-        "call",
-        "--session",
-        "--dest",
-        "org.gnome.Shell",
-        "--object-path",
-        "/org/easyspeak/Desktop",
-        "--method",
-        f"org.easyspeak.Desktop.{method}",
-    ]
-    cmd.extend(str(a) for a in args)
-    result = host_run(cmd)
-    return result.returncode == 0
+    return _desktop_call(method, *args) is not None
 
 
 def get_screen_size():
+    """Return the screen size, looking it up at most once per SCREEN_SIZE_TTL.
+
+    A failed lookup isn't cached, so the default is only used until the
+    extension answers.
+    """
+    global _screen_size_cache
+    now = time.monotonic()
+    if _screen_size_cache and now - _screen_size_cache[1] < SCREEN_SIZE_TTL:
+        return _screen_size_cache[0]
+    size = _query_screen_size()
+    if size is None:
+        return DEFAULT_SCREEN_SIZE
+    _screen_size_cache = (size, now)
+    return size
+
+
+def _query_screen_size():
     """Get screen size from GNOME Shell extension (accurate for Wayland)."""
-    result = host_run(
-        [
-            "gdbus",
-            "call",
-            "--session",
-            "--dest",
-            "org.gnome.Shell",
-            "--object-path",
-            "/org/easyspeak/Desktop",
-            "--method",
-            "org.easyspeak.Desktop.GetScreenSize",
-        ]
-    )
-
-    if result.returncode == 0:
-        # Parse output like "((1920, 1200),)"
-
-        match = re.search(r"\((\d+),\s*(\d+)\)", result.stdout)
+    body = _desktop_call("GetScreenSize")
+    if body is not None:
+        return tuple(body)
+
+    # Fallback to the mode list of the first connector that has one
+    for card in DRM_CONNECTORS:
+        try:
+            modes = (DRM_DIR / card / "modes").read_text()
+        except OSError:
+            continue
+        match = re.match(r"(\d+)x(\d+)", modes.strip())
         if match:
             return int(match.group(1)), int(match.group(2))
-
-    # Fallback to /sys/class/drm
-    for card in [
-        "card0-eDP-1",
-        "card1-eDP-1",
-        "card0-DP-1",
-        "card1-DP-1",
-        "card0-HDMI-A-1",
-        "card1-HDMI-A-1",
-    ]:
-        result = host_run(["cat", f"/sys/class/drm/{card}/modes"])
-        if result.returncode == 0 and result.stdout.strip():
-            match = re.match(r"(\d+)x(\d+)", result.stdout.strip().split("\n")[0])
-            if match:
-                return int(match.group(1)), int(match.group(2))
-    return 1920, 1080
+    return None
 
 
 def _release_pending_drag():
@@ -211,15 +262,17 @@ def cleanup():
 atexit.register(cleanup)
 
 
+def _words_to_digits(text):
+    """Replace every spoken number word in lowercase text with its digit."""
+    return NUMBER_WORD.sub(lambda match: str(WORD_TO_NUM[match[1]]), text)
+
+
 def parse_number_sequence(text):
     """Extract ALL numbers from text as a sequence.
 
     '3 7 5' -> [3, 7, 5].
     """
-    # Replace word numbers with digits
-    text_lower = text.lower()
-    for word, num in WORD_TO_NUM.items():
-        text_lower = re.sub(rf"\b{word}\b", str(num), text_lower)
+    text_lower = _words_to_digits(text.lower())
 
     # Extract all single digits (grid zones are 1-9)
     return [int(char) for char in text_lower if char.isdigit() and char != "0"]
@@ -230,9 +283,7 @@ def parse_count(text):
 
     Returns single number or 1.
     """
-    text_lower = text.lower()
-    for word, num in WORD_TO_NUM.items():
-        text_lower = re.sub(rf"\b{word}\b", str(num), text_lower)
+    text_lower = _words_to_digits(text.lower())
 
     match = re.search(r"\b(\d+)\b", text_lower)
     if match:
@@ -286,11 +337,8 @@ def close_grid():
     grid_bounds = None
 
 
-def update_grid(zone):
-    """Zoom to a single zone.
-
-    Returns True if successful.
-    """
+def _zoom(zone):
+    """Narrow grid_bounds to one zone of the current cell; False if it can't."""
     global grid_bounds
 
     if not grid_active or not grid_bounds:
@@ -299,47 +347,44 @@ def update_grid(zone):
     x, y, w, h = grid_bounds
     zone_w, zone_h = w // 3, h // 3
 
-    zone_map = {
-        1: (0, 0),
-        2: (1, 0),
-        3: (2, 0),  # top row
-        4: (0, 1),
-        5: (1, 1),
-        6: (2, 1),  # middle row
-        7: (0, 2),
-        8: (1, 2),
-        9: (2, 2),  # bottom row
-    }
-
-    if zone not in zone_map:
+    if zone not in ZONE_CELLS:
         return False
 
-    col, row = zone_map[zone]
-    new_x = x + col * zone_w
-    new_y = y + row * zone_h
-
-    # Only clamp if actually going off-screen (shouldn't happen, but safety)
-    new_x = max(new_x, 0)
-    new_y = max(new_y, 0)
-    if new_x + zone_w > screen_size[0]:
-        new_x = screen_size[0] - zone_w
-    if new_y + zone_h > screen_size[1]:
-        new_y = screen_size[1] - zone_h
+    col, row = ZONE_CELLS[zone]
+    # Keep the cell on screen (shouldn't be needed, but safety)
+    new_x = min(max(x + col * zone_w, 0), screen_size[0] - zone_w)
+    new_y = min(max(y + row * zone_h, 0), screen_size[1] - zone_h)
 
     grid_bounds = (new_x, new_y, zone_w, zone_h)
 
     cx, cy = get_center()
     logger.debug("  → Zone %s: %sx%s center=(%s, %s)", zone, zone_w, zone_h, cx, cy)
-    return dbus_call("Update", new_x, new_y, zone_w, zone_h)
+    return True
+
+
+def update_grid(zone):
+    """Zoom to a single zone.
+
+    Returns True if successful.
+    """
+    if not _zoom(zone):
+        return False
+    return dbus_call("Update", *grid_bounds)
 
 
 def process_zones(zones):
     """Process a sequence of zones.
 
-    'three seven five' zooms 3 times.
+    'three seven five' zooms 3 times. The steps are worked out here and the grid
+    is redrawn once, at the final cell; the intermediate cells would only flash
+    past on screen.
     """
+    zoomed = False
     for zone in zones:
-        update_grid(zone)
+        if _zoom(zone):
+            zoomed = True
+    if zoomed:
+        dbus_call("Update", *grid_bounds)
 
 
 # === Click Operations ===
@@ -404,6 +449,10 @@ def nudge_grid(direction, count=1):
     elif direction == "right":
         x = min(screen_size[0] - w, x + amount)
 
+    if (x, y, w, h) == grid_bounds:
+        logger.debug("  → Nudge %s: already at the edge", direction)
+        return True
+
     grid_bounds = (x, y, w, h)
     cx, cy = get_center()
     logger.debug("  → Nudge %s x%s: center=(%s, %s)", direction, count, cx, cy)
@@ -533,19 +582,7 @@ def _run_grid_mode(core):
         logger.debug("  ← %s", cmd_lower)
 
         # === Exit ===
-        if any(
-            w in cmd_lower
-            for w in [
-                "close",
-                "cancel",
-                "escape",
-                "exit",
-                "hide",
-                "stop",
-                "done",
-                "quit",
-            ]
-        ):
+        if any(word in cmd_lower for word in EXIT_WORDS):
             close_grid()
             core.speak("Grid closed")
             logger.info("Grid closed")
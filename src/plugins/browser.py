@@ -4,6 +4,7 @@ import logging
 import re
 import subprocess
 import time
+from functools import lru_cache
 from pathlib import Path
 
 from easyspeak.core import mediakeys
@@ -179,6 +180,10 @@ REQUIRED_QUTEBROWSER_LINES = [
 ]
 
 
+# `qutebrowser --version` lists the adblock module as `adblock: <version>`.
+ADBLOCK_AVAILABLE = re.compile(r"^\s*adblock:\s*\d", re.MULTILINE)
+
+
 def adblock_method():
     """Return the strongest ad-blocking method qutebrowser can actually run.
 
@@ -210,7 +215,7 @@ def adblock_method():
         )
     except (OSError, subprocess.TimeoutExpired):
         return "hosts"  # no qutebrowser, or it hung: host blocking always works
-    available = re.search(r"^\s*adblock:\s*\d", version.stdout, re.MULTILINE)
+    available = ADBLOCK_AVAILABLE.search(version.stdout)
     return "both" if available else "hosts"
 
 
@@ -222,6 +227,10 @@ def required_qutebrowser_lines():
     ]
 
 
+# `c.<setting> = <value>`, however the user spaced it.
+SETTING_ASSIGNMENT = re.compile(r"^\s*(c\.[^=\s]+)\s*=\s*\S")
+
+
 def _setting_name(line):
     """The `c.…` setting a config line assigns, or None if it isn't an assignment.
 
@@ -229,7 +238,7 @@ def _setting_name(line):
     `c.foo='bar'` or `c.foo  =  'bar'` -- is still recognised. Missing it would
     append a second assignment for the same setting on every start.
     """
-    match = re.match(r"^\s*(c\.[^=\s]+)\s*=\s*\S", line)
+    match = SETTING_ASSIGNMENT.match(line)
     return match.group(1) if match else None
 
 
@@ -364,97 +373,114 @@ def qb_open(url):
     core.host_run(["qutebrowser", url])
 
 
+# A word between the spaces and punctuation Whisper puts around spoken numbers
+# ("zero, two!", "one-two"). Compiled once: the hint parsers run on every
+# utterance in browser mode, and findall() splits in a single pass.
+HINT_WORD = re.compile(r"[^.,!?\-\s]+")
+HINT_SEPARATORS = re.compile(r"[.,!?\-\s]")
+NOT_ALPHANUMERIC = re.compile(r"[^0-9a-z]")
+# Whisper often writes a spoken "oh" as the letter: "o2" means hint 02.
+OH_AS_ZERO = str.maketrans("o", "0")
+
+# The parsers below are pure and see the same few short utterances over and over
+# in browser mode ("zero two", "o2"), so each remembers its recent answers.
+PARSE_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_hint_numbers(cmd):
     """Extract hint numbers from spoken words."""
-    clean = re.sub(r"[.,!?\-]", " ", cmd.lower())
-    words = clean.split()
-    digits = [HINT_NUMBERS[word] for word in words if word in HINT_NUMBERS]
-    return "".join(digits)
+    words = HINT_WORD.findall(cmd.lower())
+    return "".join(HINT_NUMBERS[word] for word in words if word in HINT_NUMBERS)
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def looks_like_hint(cmd):
     """Check if command looks like a hint number (short, mostly digits/number words)."""
-    clean = re.sub(r"[.,!?\-\s]", "", cmd.lower())
+    clean = HINT_SEPARATORS.sub("", cmd.lower())
     # Must be short
     if len(clean) > 6:
         return False
     # Direct digits like "02", "92"
-    if clean.replace("o", "0").isdigit():
+    if clean.translate(OH_AS_ZERO).isdigit():
         return True
     # Check if all words are number words
     words = cmd.lower().split()
     return len(words) <= 3 and all(w.strip(".,!?") in HINT_NUMBERS for w in words)
 
 
+# Number words for parse_hint_number: HINT_NUMBERS' words plus ordinals, more
+# near-misses, and the teens and tens ("ninety three" reads as 9 then 3).
+HINT_NUMBER_WORDS = {
+    "zero": "0",
+    "oh": "0",
+    "o": "0",
+    "one": "1",
+    "won": "1",
+    "wan": "1",
+    "two": "2",
+    "to": "2",
+    "too": "2",
+    "tu": "2",
+    "three": "3",
+    "tree": "3",
+    "free": "3",
+    "third": "3",
+    "thee": "3",
+    "four": "4",
+    "for": "4",
+    "fore": "4",
+    "ford": "4",
+    "forth": "4",
+    "fourth": "4",
+    "far": "4",
+    "five": "5",
+    "six": "6",
+    "sex": "6",
+    "seven": "7",
+    "eight": "8",
+    "ate": "8",
+    "eighth": "8",
+    "hate": "8",
+    "nine": "9",
+    "nein": "9",
+    "ninth": "9",
+    "mine": "9",
+    # Tens
+    "ten": "10",
+    "eleven": "11",
+    "twelve": "12",
+    "thirteen": "13",
+    "fourteen": "14",
+    "fifteen": "15",
+    "sixteen": "16",
+    "seventeen": "17",
+    "eighteen": "18",
+    "nineteen": "19",
+    "twenty": "2",
+    "thirty": "3",
+    "forty": "4",
+    "fifty": "5",
+    "sixty": "6",
+    "seventy": "7",
+    "eighty": "8",
+    "ninety": "9",
+}
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_hint_number(cmd):
     """Parse spoken numbers into a hint string ('zero two' -> '02')."""
-    # Number word mappings
-    NUM_WORDS = {
-        "zero": "0",
-        "oh": "0",
-        "o": "0",
-        "one": "1",
-        "won": "1",
-        "wan": "1",
-        "two": "2",
-        "to": "2",
-        "too": "2",
-        "tu": "2",
-        "three": "3",
-        "tree": "3",
-        "free": "3",
-        "third": "3",
-        "thee": "3",
-        "four": "4",
-        "for": "4",
-        "fore": "4",
-        "ford": "4",
-        "forth": "4",
-        "fourth": "4",
-        "far": "4",
-        "five": "5",
-        "six": "6",
-        "sex": "6",
-        "seven": "7",
-        "eight": "8",
-        "ate": "8",
-        "eighth": "8",
-        "hate": "8",
-        "nine": "9",
-        "nein": "9",
-        "ninth": "9",
-        "mine": "9",
-        # Tens
-        "ten": "10",
-        "eleven": "11",
-        "twelve": "12",
-        "thirteen": "13",
-        "fourteen": "14",
-        "fifteen": "15",
-        "sixteen": "16",
-        "seventeen": "17",
-        "eighteen": "18",
-        "nineteen": "19",
-        "twenty": "2",
-        "thirty": "3",
-        "forty": "4",
-        "fifty": "5",
-        "sixty": "6",
-        "seventy": "7",
-        "eighty": "8",
-        "ninety": "9",
-    }
-
     result = []
-    words = re.sub(r"[.,!?\-]", " ", cmd.lower()).split()
+    words = HINT_WORD.findall(cmd.lower())
 
     for word in words:
         # Direct digit
         if word.isdigit():
             result.append(word)
         # Word to digit
-        elif word in NUM_WORDS:
-            result.append(NUM_WORDS[word])
+        elif word in HINT_NUMBER_WORDS:
+            result.append(HINT_NUMBER_WORDS[word])
 
     return "".join(result)
 
@@ -473,17 +499,21 @@ TAB_PREFIXES = (
 )
 
 
+# All of TAB_PREFIXES in one pattern, so a command is matched in a single pass.
+# No prefix begins another, so the alternation order can't change the result.
+TAB_COMMAND = re.compile(rf"^(?:{'|'.join(map(re.escape, TAB_PREFIXES))}) (.*)$")
+
+
 def parse_tab_number(cmd_lower):
     """The tab number a command names, or None if it doesn't name one."""
-    for prefix in TAB_PREFIXES:
-        if not cmd_lower.startswith(prefix + " "):
-            continue
-        number = parse_hint_number(cmd_lower[len(prefix) :].strip())
-        if number and number.isdigit():
-            return number
-    return None
+    match = TAB_COMMAND.match(cmd_lower)
+    if match is None:
+        return None
+    number = parse_hint_number(match.group(1).strip())
+    return number if number and number.isdigit() else None
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_spoken_url(spoken):
     """Convert spoken URL to actual URL.
 
@@ -812,112 +842,152 @@ def strip_filler(cmd_lower):
     return cmd_lower
 
 
-def handle_browser_command(cmd_lower, core):
-    """Execute a single in-browser command; None if it isn't recognised."""
-    cmd_lower = strip_filler(cmd_lower)
+def _show_hints_and_listen(core):
+    show_hints(core)
+    listen_for_hint(core)
 
-    # Said a beat after hint mode already closed; absorbing it beats answering
-    # "I didn't understand" to a phrase this plugin owns.
-    if cmd_lower in ("exit links", "exit link"):
-        return True
-    # --- Hints ---
-    if cmd_lower in [
-        "numbers",
-        "number",
-        "hints",
-        "hint",
-        "show numbers",
-        "show hints",
-        "links",
-        "link",
-        "blanks",
-        "blinks",
-        "lynx",
-        "lings",
-        "lanes",
-        "licks",
-        "clicks",
-    ]:
-        show_hints(core)
-        listen_for_hint(core)
-        return True
 
-    if cmd_lower in [
-        "numbers new",
-        "number new",
-        "hints new",
-        "new numbers",
-        "links new",
-        "link new",
-        "blanks new",
-        "blinks new",
-        "lynx new",
-    ]:
-        qb("hint links tab")
-        listen_for_hint(core)
-        return True
+def _hint_into_new_tab(core):
+    qb("hint links tab")
+    listen_for_hint(core)
 
-    # --- Navigation ---
-    if cmd_lower in ["back", "go back", "previous page"]:
-        qb("back")
-        core.browser_page_js_stale = True
-        return True
 
-    if cmd_lower in ["forward", "go forward", "next page"]:
-        qb("forward")
+def _history(direction):
+    """Go back or forward; the page that comes up may need a reload to hint."""
+
+    def navigate(core):
+        qb(direction)
         core.browser_page_js_stale = True
-        return True
 
-    if cmd_lower in ["reload", "refresh", "reload page"]:
-        qb("reload")
-        return True
+    return navigate
 
-    if cmd_lower in ["stop", "stop loading"]:
-        qb("stop")
-        return True
 
-    # --- Scrolling ---
-    if cmd_lower in ["scroll down", "down"]:
-        scroll_page(SCROLL_DOWN_JS, core)
-        return True
+def _qb_command(command):
+    return lambda _core: qb(command)
 
-    if cmd_lower in ["scroll up", "up"]:
-        scroll_page(SCROLL_UP_JS, core)
-        return True
 
-    if "page" in cmd_lower and "down" in cmd_lower:
-        qb(f"jseval -q {PAGE_DOWN_JS}")
-        return True
+def _scroll(js):
+    return lambda core: scroll_page(js, core)
 
-    if "page" in cmd_lower and "up" in cmd_lower:
-        qb(f"jseval -q {PAGE_UP_JS}")
-        return True
 
-    if cmd_lower in ["top", "go to top", "scroll to top"]:
-        scroll_page(SCROLL_TOP_JS, core)
-        return True
+def _config_toggle(line, spoken, *, wanted):
+    return lambda core: _apply_config_line(core, line, spoken, wanted=wanted)
 
-    if cmd_lower in ["bottom", "go to bottom", "scroll to bottom"]:
-        scroll_page(SCROLL_BOTTOM_JS, core)
-        return True
 
-    # --- Tabs ---
-    if cmd_lower in ["new tab", "open tab"]:
-        qb("open -t about:blank")
-        return True
+# Every fixed phrase handle_browser_command answers, mapped to its action, so
+# most commands are one dict lookup instead of a walk down a chain of lists.
+# Phrases that need pattern matching (page up/down, tab numbers, find, keys,
+# bookmarks, search, hints) are still tried in order after this.
+BROWSER_COMMANDS = {
+    phrase: action
+    for phrases, action in (
+        # Said a beat after hint mode already closed; absorbing it beats
+        # answering "I didn't understand" to a phrase this plugin owns.
+        (("exit links", "exit link"), lambda _core: None),
+        # --- Hints ---
+        (
+            (
+                "numbers",
+                "number",
+                "hints",
+                "hint",
+                "show numbers",
+                "show hints",
+                "links",
+                "link",
+                "blanks",
+                "blinks",
+                "lynx",
+                "lings",
+                "lanes",
+                "licks",
+                "clicks",
+            ),
+            _show_hints_and_listen,
+        ),
+        (
+            (
+                "numbers new",
+                "number new",
+                "hints new",
+                "new numbers",
+                "links new",
+                "link new",
+                "blanks new",
+                "blinks new",
+                "lynx new",
+            ),
+            _hint_into_new_tab,
+        ),
+        # --- Navigation ---
+        (("back", "go back", "previous page"), _history("back")),
+        (("forward", "go forward", "next page"), _history("forward")),
+        (("reload", "refresh", "reload page"), _qb_command("reload")),
+        (("stop", "stop loading"), _qb_command("stop")),
+        # --- Scrolling ---
+        (("scroll down", "down"), _scroll(SCROLL_DOWN_JS)),
+        (("scroll up", "up"), _scroll(SCROLL_UP_JS)),
+        (("top", "go to top", "scroll to top"), _scroll(SCROLL_TOP_JS)),
+        (("bottom", "go to bottom", "scroll to bottom"), _scroll(SCROLL_BOTTOM_JS)),
+        # --- Tabs ---
+        (("new tab", "open tab"), _qb_command("open -t about:blank")),
+        (("close tab", "close this tab"), _qb_command("tab-close")),
+        (
+            ("next tab", "tab right", "switch tab", "change tab"),
+            _qb_command("tab-next"),
+        ),
+        (("last tab", "previous tab", "tab left"), _qb_command("tab-prev")),
+        (("undo tab", "restore tab", "reopen tab"), _qb_command("undo")),
+        # --- Find ("find next" and "find previous" are searches for the word) ---
+        (("next match",), _qb_command("search-next")),
+        (("previous match",), _qb_command("search-prev")),
+        # --- Escape ---
+        (("escape", "cancel", "nevermind"), _qb_command("fake-key <Escape>")),
+        # --- Browser config toggles ---
+        (
+            ("software rendering", "fix rendering", "fix the display"),
+            _config_toggle(
+                SOFTWARE_RENDERING_LINE, "Software rendering on", wanted=True
+            ),
+        ),
+        (
+            ("hardware rendering", "restore rendering"),
+            _config_toggle(
+                SOFTWARE_RENDERING_LINE, "Hardware rendering on", wanted=False
+            ),
+        ),
+        (
+            ("allow ads", "stop blocking ads", "disable ad blocking"),
+            _config_toggle(ADBLOCK_OFF_LINE, "Ad blocking off", wanted=True),
+        ),
+        (
+            ("block ads", "enable ad blocking"),
+            _config_toggle(ADBLOCK_OFF_LINE, "Ad blocking on", wanted=False),
+        ),
+    )
+    for phrase in phrases
+}
 
-    if cmd_lower in ["close tab", "close this tab"]:
-        qb("tab-close")
+
+def handle_browser_command(cmd_lower, core):
+    """Execute a single in-browser command; None if it isn't recognised."""
+    cmd_lower = strip_filler(cmd_lower)
+
+    action = BROWSER_COMMANDS.get(cmd_lower)
+    if action is not None:
+        action(core)
         return True
 
-    if cmd_lower in ["next tab", "tab right", "switch tab", "change tab"]:
-        qb("tab-next")
+    # --- Page scrolling ---
+    if "page" in cmd_lower and "down" in cmd_lower:
+        qb(f"jseval -q {PAGE_DOWN_JS}")
         return True
 
-    if cmd_lower in ["last tab", "previous tab", "tab left"]:
-        qb("tab-prev")
+    if "page" in cmd_lower and "up" in cmd_lower:
+        qb(f"jseval -q {PAGE_UP_JS}")
         return True
 
+    # --- Tab by number ---
     tab_num = parse_tab_number(cmd_lower)
     if tab_num is not None:
         if cmd_lower.startswith("close"):
@@ -927,10 +997,6 @@ def handle_browser_command(cmd_lower, core):
             qb(f"tab-focus {tab_num}")
         return True
 
-    if cmd_lower in ["undo tab", "restore tab", "reopen tab"]:
-        qb("undo")
-        return True
-
     # --- Find ---
     if cmd_lower.startswith("find "):
         query = cmd_lower.replace("find ", "", 1).strip()
@@ -938,40 +1004,6 @@ def handle_browser_command(cmd_lower, core):
             qb(f"search {query}")
             return True
 
-    if cmd_lower in ["find next", "next match"]:
-        qb("search-next")
-        return True
-
-    if cmd_lower in ["find previous", "previous match"]:
-        qb("search-prev")
-        return True
-
-    # --- Escape ---
-    if cmd_lower in ["escape", "cancel", "nevermind"]:
-        qb("fake-key <Escape>")
-        return True
-
-    # --- Browser config toggles ---
-    if cmd_lower in ["software rendering", "fix rendering", "fix the display"]:
-        return _apply_config_line(
-            core, SOFTWARE_RENDERING_LINE, "Software rendering on", wanted=True
-        )
-
-    if cmd_lower in ["hardware rendering", "restore rendering"]:
-        return _apply_config_line(
-            core, SOFTWARE_RENDERING_LINE, "Hardware rendering on", wanted=False
-        )
-
-    if cmd_lower in ["allow ads", "stop blocking ads", "disable ad blocking"]:
-        return _apply_config_line(
-            core, ADBLOCK_OFF_LINE, "Ad blocking off", wanted=True
-        )
-
-    if cmd_lower in ["block ads", "enable ad blocking"]:
-        return _apply_config_line(
-            core, ADBLOCK_OFF_LINE, "Ad blocking on", wanted=False
-        )
-
     # --- Keystrokes ---
     request = mediakeys.parse_key_request(cmd_lower.split(), BARE_KEYS)
     if request is not None:
@@ -995,11 +1027,11 @@ def handle_browser_command(cmd_lower, core):
         target = cmd_lower.replace("go to ", "").replace("open ", "").strip()
 
         # Check predefined bookmarks first
-        for site, url in BOOKMARKS.items():
-            if site == target:
-                core.speak(f"Opening {site}.")
-                qb_open(url)
-                return True
+        url = BOOKMARKS.get(target)
+        if url is not None:
+            core.speak(f"Opening {target}.")
+            qb_open(url)
+            return True
 
         # Try as spoken URL (contains "dot")
         if "dot" in target or "." in target:
@@ -1029,9 +1061,8 @@ def handle_browser_command(cmd_lower, core):
     # Only try hint parsing if it actually looks like a hint
     if looks_like_hint(cmd_lower):
         # Direct digit input (e.g., "02", "92", "0-2")
-        stripped = re.sub(r"[^0-9a-z]", "", cmd_lower)
-        if stripped.replace("o", "0").isdigit():
-            hint = stripped.replace("o", "0")
+        hint = NOT_ALPHANUMERIC.sub("", cmd_lower).translate(OH_AS_ZERO)
+        if hint.isdigit():
             logger.debug("  🔤 Direct digits: '%s' → '%s'", cmd_lower, hint)
             qb(f"hint-follow {hint}")
             return True
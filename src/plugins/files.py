@@ -1,5 +1,7 @@
 """Files Plugin - Open folders in file manager."""
 
+import re
+import shutil
 from pathlib import Path
 
 NAME = "files"
@@ -25,6 +27,18 @@ FOLDERS = {
     "desktop": "~/Desktop",
 }
 
+
+def _whole_words(phrases):
+    """Compile one pattern matching any of `phrases` as whole words."""
+    return re.compile(rf"\b({'|'.join(map(re.escape, phrases))})\b")
+
+
+# Compiled once from the tables above. Whole words, so "home" isn't found in
+# "homework" or "show" in "shower".
+OPEN_VERB = _whole_words(OPEN_VERBS)
+FOLDER_NAME = _whole_words(FOLDERS)
+FILE_MANAGER_PHRASE = _whole_words(FILE_MANAGER_PHRASES)
+
 core = None
 
 
@@ -43,7 +57,7 @@ def open_folder(path, core):
     paths.
     """
     expanded = Path(path).expanduser()
-    if core.host_run(["which", "xdg-open"]).returncode != 0:
+    if shutil.which("xdg-open") is None:
         return False
     core.host_run(["xdg-open", expanded], background=True, clean_env=True)
     return True
@@ -51,15 +65,16 @@ def open_folder(path, core):
 
 def handle(cmd, core):
     """Open a named folder, or the file manager itself; None if neither matched."""
-    if not any(verb in cmd for verb in OPEN_VERBS):
+    if not OPEN_VERB.search(cmd):
         return None
 
-    for folder, path in FOLDERS.items():
-        if folder in cmd:
-            _open(path, folder, core)
-            return True
+    named = FOLDER_NAME.search(cmd)
+    if named:
+        folder = named[1]
+        _open(FOLDERS[folder], folder, core)
+        return True
 
-    if any(phrase in cmd for phrase in FILE_MANAGER_PHRASES):
+    if FILE_MANAGER_PHRASE.search(cmd):
         _open("~", "files", core)
         return True
 
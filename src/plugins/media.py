@@ -1,5 +1,8 @@
 """Media Plugin - Playback controls via MPRIS."""
 
+from easyspeak.core import session_bus
+from jeepney import DBusAddress, new_method_call
+
 NAME = "media"
 DESCRIPTION = "Media playback controls"
 
@@ -53,6 +56,24 @@ FEEDBACK = {
     "previous": "Previous.",
 }
 
+# Every MPRIS player owns a bus name under this prefix.
+MPRIS_PREFIX = "org.mpris.MediaPlayer2."
+
+# The bus daemon itself, asked for the names currently on the session bus.
+BUS_DAEMON = DBusAddress(
+    "/org/freedesktop/DBus",
+    bus_name="org.freedesktop.DBus",
+    interface="org.freedesktop.DBus",
+)
+
+# MPRIS method for each action.
+METHODS = {
+    "play": "Play",
+    "pause": "Pause",
+    "next": "Next",
+    "previous": "Previous",
+}
+
 core = None
 
 
@@ -62,57 +83,40 @@ def setup(c):
     core = c
 
 
-def get_media_players(core):
+def get_media_players():
     """Return the bus names of all running MPRIS media players."""
-    result = core.host_run(
-        [
-            "dbus-send",
-            "--session",
-            "--dest=org.freedesktop.DBus",
-            "--type=method_call",
-            "--print-reply",
-            "/org/freedesktop/DBus",
-            "org.freedesktop.DBus.ListNames",
-        ]
+    reply = session_bus.connection().send_and_get_reply(
+        new_method_call(BUS_DAEMON, "ListNames"), timeout=session_bus.TIMEOUT
     )
-    return [
-        line.split('"')[1]
-        for line in result.stdout.split("\n")
-        if "org.mpris.MediaPlayer2." in line
-    ]
+    return [name for name in reply.body[0] if name.startswith(MPRIS_PREFIX)]
 
 
-def media_control(action, core):
+def media_control(action):
     """Send an MPRIS action (play/pause/next/previous) to every running player.
 
-    Returns False if no player is running or the action is unknown.
+    Returns False if no player is running, the action is unknown or the session
+    bus can't be reached.
     """
-    players = get_media_players(core)
-    if not players:
-        return False
-
-    method = {
-        "play": "Play",
-        "pause": "Pause",
-        "next": "Next",
-        "previous": "Previous",
-    }.get(action)
-
-    if not method:
+    method = METHODS.get(action)
+    if method is None:
         return False
 
-    for player in players:
-        core.host_run(
-            [
-                "dbus-send",
-                "--session",
-                "--type=method_call",
-                f"--dest={player}",
+    try:
+        players = get_media_players()
+        for player in players:
+            player_address = DBusAddress(
                 "/org/mpris/MediaPlayer2",
-                f"org.mpris.MediaPlayer2.Player.{method}",
-            ]
-        )
-    return True
+                bus_name=player,
+                interface="org.mpris.MediaPlayer2.Player",
+            )
+            # Fire and forget, as dbus-send did: a player that never answers
+            # mustn't stall the voice loop. Its reply is read and discarded
+            # along the way by the next call that waits for one.
+            session_bus.connection().send(new_method_call(player_address, method))
+    except session_bus.ERRORS:
+        session_bus.drop()
+        return False
+    return bool(players)
 
 
 def _action_for(cmd):
@@ -147,7 +151,7 @@ def handle(cmd, core):
     if action is None:
         return None  # Not handled
 
-    if not media_control(action, core):
+    if not media_control(action):
         core.speak("No media player is running.")
         return True
 
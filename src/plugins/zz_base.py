@@ -62,11 +62,10 @@ def show_help(core):
     request (the spoken reply tells the user to read the terminal), so it must
     appear regardless of the configured log verbosity.
     """
-    print("\n=== Available Commands ===")  # noqa: T201
+    lines = ["", "=== Available Commands ==="]
     for plugin in core.plugins:
         if hasattr(plugin, "COMMANDS"):
-            print(f"\n{plugin.NAME}:")  # noqa: T201
-            for cmd in plugin.COMMANDS:
-                print(f"  • {cmd}")  # noqa: T201
-    print()  # noqa: T201
+            lines += ["", f"{plugin.NAME}:"]
+            lines += [f"  • {cmd}" for cmd in plugin.COMMANDS]
+    print("\n".join(lines) + "\n")  # noqa: T201
     core.speak("Check the terminal for available commands.")
@@ -0,0 +1,41 @@
+"""Tests for the session_bus module."""
+
+from unittest.mock import Mock
+
+import pytest
+from easyspeak.core import session_bus
+
+
+@pytest.fixture
+def opener(monkeypatch):
+    """Stand-in for open_dbus_connection, with no connection open yet."""
+    monkeypatch.setattr(session_bus, "_bus", None)
+    stub = Mock(side_effect=lambda bus: Mock())
+    monkeypatch.setattr(session_bus, "open_dbus_connection", stub)
+    return stub
+
+
+def test_connection_is_opened_once(opener):
+    """When connection is called repeatedly then every caller shares one session bus."""
+    first = session_bus.connection()
+
+    assert session_bus.connection() is first
+    opener.assert_called_once_with(bus="SESSION")
+
+
+def test_drop_closes_and_forgets_the_connection(opener):
+    """When drop is called then the connection is closed and the next call reopens."""
+    first = session_bus.connection()
+
+    session_bus.drop()
+
+    assert first.close.called
+    assert session_bus.connection() is not first
+    assert opener.call_count == 2
+
+
+def test_drop_without_a_connection(opener):
+    """When nothing has been opened then drop does nothing."""
+    session_bus.drop()
+
+    assert not opener.called
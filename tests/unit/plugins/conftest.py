@@ -1,5 +1,7 @@
 """Pytest fixtures for plugin tests."""
 
+import sys
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
@@ -42,6 +44,35 @@ def attach_listen_modal(core):
     return core
 
 
+@pytest.fixture(autouse=True)
+def _restore_plugin_core(monkeypatch):
+    """Put every plugin's ``core`` global back once the test ends.
+
+    setup() assigns it, so without this the core one test hands a plugin would
+    still be there for the next.
+    """
+    for name, module in list(sys.modules.items()):
+        if name.startswith("easyspeak.plugins.") and hasattr(module, "core"):
+            monkeypatch.setattr(module, "core", module.core)
+
+
+@pytest.fixture
+def stub_attrs(monkeypatch):
+    """Factory fixture that swaps module attributes for stand-ins for one test.
+
+    ``stub_attrs(module, name=stub, ...)`` sets each stub on the module and
+    returns them as a SimpleNamespace keyed by attribute name, so a fixture
+    grouping a plugin's stand-ins is just the call.
+    """
+
+    def _stub_attrs(module, **stubs):
+        for name, stub in stubs.items():
+            monkeypatch.setattr(module, name, stub)
+        return SimpleNamespace(**stubs)
+
+    return _stub_attrs
+
+
 @pytest.fixture
 def mock_core():
     """Create a mock core object for testing plugins.
@@ -49,6 +80,10 @@ def mock_core():
     Session flags a plugin's setup() would set are set here too. A bare Mock
     invents any attribute asked of it and every invented one is truthy, so
     without this a flag meaning "already in browser mode" reads as True.
+
+    A fresh core per test, deliberately: plugins assign attributes on it (those
+    flags among them), and ``reset_mock()`` clears calls but not assignments, so
+    a core shared across a module would carry one test's state into the next.
     """
     core = Mock()
     core.stream.read = Mock()
@@ -61,14 +96,14 @@ def mock_core():
 @pytest.fixture
 def mock_core_success(mock_core):
     """Create a mock core with host_run returning success (returncode=0)."""
-    mock_core.host_run.return_value = Mock(returncode=0)
+    mock_core.host_run.return_value = SimpleNamespace(returncode=0)
     return mock_core
 
 
 @pytest.fixture
 def mock_core_failure(mock_core):
     """Create a mock core with host_run returning failure (returncode=1)."""
-    mock_core.host_run.return_value = Mock(returncode=1)
+    mock_core.host_run.return_value = SimpleNamespace(returncode=1)
     return mock_core
 
 
@@ -83,33 +118,6 @@ def mock_core_with_audio():
     return attach_listen_modal(core)
 
 
-@pytest.fixture
-def mock_core_no_file_manager():
-    """Create a mock core that simulates no file manager being available."""
-    core = Mock()
-    core.host_run = Mock(return_value=Mock(returncode=1))
-    core.speak = Mock()
-    return core
-
-
-@pytest.fixture
-def mock_core_which_finds_file_manager():
-    """Factory fixture that creates a mock core simulating finding a specific file manager."""
-
-    def _create_mock(file_manager):
-        def side_effect(cmd, **kwargs):
-            result = Mock()
-            result.returncode = 0 if cmd[1] == file_manager else 1
-            return result
-
-        core = Mock()
-        core.host_run = Mock(side_effect=side_effect)
-        core.speak = Mock()
-        return core
-
-    return _create_mock
-
-
 @pytest.fixture
 def mock_core_factory():
     """Factory fixture to create mock core with custom transcription setup."""
@@ -16,11 +16,11 @@ def test_setup(mock_core):
 @pytest.mark.parametrize(
     ["app_name", "flatpak_id"],
     [
-        ["firefox", "org.mozilla.firefox"],
-        ["steam", "com.valvesoftware.Steam"],
-        ["spotify", "com.spotify.Client"],
-        ["calculator", "org.gnome.Calculator"],
-        ["settings", "org.gnome.Settings"],
+        ("firefox", "org.mozilla.firefox"),
+        ("steam", "com.valvesoftware.Steam"),
+        ("spotify", "com.spotify.Client"),
+        ("calculator", "org.gnome.Calculator"),
+        ("settings", "org.gnome.Settings"),
     ],
 )
 def test_find_app_flatpak_installed(mock_core_success, app_name, flatpak_id):
@@ -35,21 +35,21 @@ def test_find_app_flatpak_installed(mock_core_success, app_name, flatpak_id):
 
 
 @pytest.mark.parametrize(
-    "app_name",
+    ["app_name", "flatpak_id"],
     [
-        "firefox",
-        "steam",
-        "spotify",
+        ("firefox", "org.mozilla.firefox"),
+        ("steam", "com.valvesoftware.Steam"),
+        ("spotify", "com.spotify.Client"),
     ],
 )
-def test_find_app_flatpak_not_installed(mock_core_failure, app_name):
+def test_find_app_flatpak_not_installed(mock_core_failure, app_name, flatpak_id):
     """When flatpak app is not installed, then None is returned."""
     app_type, app_id = apps.find_app(app_name, mock_core_failure)
 
     assert app_type is None
     assert app_id is None
     assert mock_core_failure.host_run.call_count == 2
-    assert (["flatpak", "info", apps.FLATPAK_APPS[app_name]],) in [
+    assert (["flatpak", "info", flatpak_id],) in [
         c.args for c in mock_core_failure.host_run.call_args_list
     ]
     assert (["which", app_name],) in [
@@ -60,8 +60,8 @@ def test_find_app_flatpak_not_installed(mock_core_failure, app_name):
 @pytest.mark.parametrize(
     ["app_name", "binary_name"],
     [
-        ["nautilus", "nautilus"],
-        ["browser", "qutebrowser"],
+        ("nautilus", "nautilus"),
+        ("browser", "qutebrowser"),
     ],
 )
 def test_find_app_local(mock_core, app_name, binary_name):
@@ -443,12 +443,12 @@ def test_close_registered_terminal(mock_core):
 @pytest.mark.parametrize(
     ["command", "app_name"],
     [
-        ["open firefox", "firefox"],
-        ["launch steam", "steam"],
-        ["open spotify", "spotify"],
-        ["open calculator", "calculator"],
-        ["open music player", "music player"],
-        ["open music app", "music app"],
+        ("open firefox", "firefox"),
+        ("launch steam", "steam"),
+        ("open spotify", "spotify"),
+        ("open calculator", "calculator"),
+        ("open music player", "music player"),
+        ("open music app", "music app"),
     ],
 )
 def test_handle_open_installed_app(mock_launch_app, mock_core, command, app_name):
@@ -464,8 +464,8 @@ def test_handle_open_installed_app(mock_launch_app, mock_core, command, app_name
 @pytest.mark.parametrize(
     ["command", "app_name"],
     [
-        ["open firefox", "firefox"],
-        ["launch steam", "steam"],
+        ("open firefox", "firefox"),
+        ("launch steam", "steam"),
     ],
 )
 def test_handle_open_not_installed_app(mock_launch_app, mock_core, command, app_name):
@@ -481,9 +481,9 @@ def test_handle_open_not_installed_app(mock_launch_app, mock_core, command, app_
 @pytest.mark.parametrize(
     ["command", "app_name"],
     [
-        ["close firefox", "firefox"],
-        ["close steam", "steam"],
-        ["close spotify", "spotify"],
+        ("close firefox", "firefox"),
+        ("close steam", "steam"),
+        ("close spotify", "spotify"),
     ],
 )
 def test_handle_close_app(mock_close_app, mock_core, command, app_name):
@@ -210,6 +210,16 @@ def test_qb_open(mock_core):
 # Tests for handle_browser_command function.
 
 
+@pytest.fixture
+def qutebrowser(stub_attrs):
+    """Stand-ins for everything that would reach a real qutebrowser.
+
+    One fixture instead of a stack of ``@patch.object`` decorators on each of the
+    many parametrized command cases below.
+    """
+    return stub_attrs(browser, qb=Mock(), qb_open=Mock(), listen_for_hint=Mock())
+
+
 @pytest.mark.parametrize(
     "command",
     [
@@ -225,17 +235,15 @@ def test_qb_open(mock_core):
         "blinks",
     ],
 )
-@patch.object(browser, "qb")
-@patch.object(browser, "listen_for_hint")
-def test_handle_browser_command_hints(mock_listen, mock_qb, command, mock_core):
+def test_handle_browser_command_hints(qutebrowser, command, mock_core):
     """Test handling hint commands."""
     result = browser.handle_browser_command(command, mock_core)
 
     assert result is True
-    assert mock_qb.called
-    assert mock_qb.call_args.args[0] == "hint"
-    assert mock_listen.called
-    assert mock_listen.call_args.args[0] == mock_core
+    assert qutebrowser.qb.called
+    assert qutebrowser.qb.call_args.args[0] == "hint"
+    assert qutebrowser.listen_for_hint.called
+    assert qutebrowser.listen_for_hint.call_args.args[0] == mock_core
 
 
 @pytest.mark.parametrize(
@@ -249,68 +257,93 @@ def test_handle_browser_command_hints(mock_listen, mock_qb, command, mock_core):
         "link new",
     ],
 )
-@patch.object(browser, "qb")
-@patch.object(browser, "listen_for_hint")
-def test_handle_browser_command_hints_new_tab(mock_listen, mock_qb, command, mock_core):
+def test_handle_browser_command_hints_new_tab(qutebrowser, command, mock_core):
     """Test handling hint commands for new tab."""
     result = browser.handle_browser_command(command, mock_core)
 
     assert result is True
-    assert mock_qb.called
-    assert mock_qb.call_args.args[0] == "hint links tab"
-    assert mock_listen.called
-    assert mock_listen.call_args.args[0] == mock_core
+    assert qutebrowser.qb.called
+    assert qutebrowser.qb.call_args.args[0] == "hint links tab"
+    assert qutebrowser.listen_for_hint.called
+    assert qutebrowser.listen_for_hint.call_args.args[0] == mock_core
 
 
 @pytest.mark.parametrize(
     ["command", "qb_command"],
     [
-        ["back", "back"],
-        ["go back", "back"],
-        ["previous page", "back"],
-        ["forward", "forward"],
-        ["go forward", "forward"],
-        ["next page", "forward"],
-        ["reload", "reload"],
-        ["refresh", "reload"],
-        ["reload page", "reload"],
-        ["stop", "stop"],
-        ["stop loading", "stop"],
+        # Navigation
+        ("back", "back"),
+        ("go back", "back"),
+        ("previous page", "back"),
+        ("forward", "forward"),
+        ("go forward", "forward"),
+        ("next page", "forward"),
+        ("reload", "reload"),
+        ("refresh", "reload"),
+        ("reload page", "reload"),
+        ("stop", "stop"),
+        ("stop loading", "stop"),
+        # Tabs
+        ("new tab", "open -t about:blank"),
+        ("open tab", "open -t about:blank"),
+        ("close tab", "tab-close"),
+        ("close this tab", "tab-close"),
+        ("next tab", "tab-next"),
+        ("tab right", "tab-next"),
+        ("last tab", "tab-prev"),
+        ("previous tab", "tab-prev"),
+        ("tab left", "tab-prev"),
+        ("undo tab", "undo"),
+        ("restore tab", "undo"),
+        ("reopen tab", "undo"),
+        ("tab one", "tab-focus 1"),
+        ("tab two", "tab-focus 2"),
+        ("tab five", "tab-focus 5"),
+        ("tab 3", "tab-focus 3"),
+        # Find ("find next"/"find previous" search for the word itself)
+        ("find test", "search test"),
+        ("find hello world", "search hello world"),
+        ("find next", "search next"),
+        ("find previous", "search previous"),
+        ("next match", "search-next"),
+        ("previous match", "search-prev"),
+        # Escape
+        ("escape", "fake-key <Escape>"),
+        ("cancel", "fake-key <Escape>"),
+        ("nevermind", "fake-key <Escape>"),
     ],
 )
-@patch.object(browser, "qb")
-def test_handle_browser_command_navigation(mock_qb, command, qb_command, mock_core):
-    """Test handling navigation commands."""
+def test_handle_browser_command_sends(qutebrowser, command, qb_command, mock_core):
+    """Test a command that maps straight to one qutebrowser command."""
     result = browser.handle_browser_command(command, mock_core)
 
     assert result is True
-    assert mock_qb.called
-    assert mock_qb.call_args.args[0] == qb_command
+    assert qutebrowser.qb.called
+    assert qutebrowser.qb.call_args.args[0] == qb_command
 
 
 @pytest.mark.parametrize(
     ["command", "js_constant"],
     [
-        ["scroll down", "SCROLL_DOWN_JS"],
-        ["down", "SCROLL_DOWN_JS"],
-        ["scroll up", "SCROLL_UP_JS"],
-        ["up", "SCROLL_UP_JS"],
-        ["top", "SCROLL_TOP_JS"],
-        ["go to top", "SCROLL_TOP_JS"],
-        ["scroll to top", "SCROLL_TOP_JS"],
-        ["bottom", "SCROLL_BOTTOM_JS"],
-        ["go to bottom", "SCROLL_BOTTOM_JS"],
-        ["scroll to bottom", "SCROLL_BOTTOM_JS"],
+        ("scroll down", "SCROLL_DOWN_JS"),
+        ("down", "SCROLL_DOWN_JS"),
+        ("scroll up", "SCROLL_UP_JS"),
+        ("up", "SCROLL_UP_JS"),
+        ("top", "SCROLL_TOP_JS"),
+        ("go to top", "SCROLL_TOP_JS"),
+        ("scroll to top", "SCROLL_TOP_JS"),
+        ("bottom", "SCROLL_BOTTOM_JS"),
+        ("go to bottom", "SCROLL_BOTTOM_JS"),
+        ("scroll to bottom", "SCROLL_BOTTOM_JS"),
     ],
 )
-@patch.object(browser, "qb")
-def test_handle_browser_command_scrolling(mock_qb, command, js_constant, mock_core):
+def test_handle_browser_command_scrolling(qutebrowser, command, js_constant, mock_core):
     """Test handling scrolling commands."""
     result = browser.handle_browser_command(command, mock_core)
 
     assert result is True
     # Verify qb was called with jseval and the appropriate JS constant
-    call_args = mock_qb.call_args.args[0]
+    call_args = qutebrowser.qb.call_args.args[0]
     assert call_args.startswith("jseval -q")
     assert getattr(browser, js_constant) in call_args
 
@@ -318,160 +351,44 @@ def test_handle_browser_command_scrolling(mock_qb, command, js_constant, mock_co
 @pytest.mark.parametrize(
     ["command", "expected_js"],
     [
-        ["page down", "PAGE_DOWN_JS"],
-        ["page up", "PAGE_UP_JS"],
+        ("page down", "PAGE_DOWN_JS"),
+        ("page up", "PAGE_UP_JS"),
     ],
 )
-@patch.object(browser, "qb")
-def test_handle_browser_command_page_scroll(mock_qb, command, expected_js, mock_core):
+def test_handle_browser_command_page_scroll(
+    qutebrowser, command, expected_js, mock_core
+):
     """Test handling page scroll commands."""
     result = browser.handle_browser_command(command, mock_core)
 
     assert result is True
-    call_args = mock_qb.call_args.args[0]
+    call_args = qutebrowser.qb.call_args.args[0]
     assert getattr(browser, expected_js) in call_args
 
 
 @pytest.mark.parametrize(
-    ["command", "qb_command"],
-    [
-        ["new tab", "open -t about:blank"],
-        ["open tab", "open -t about:blank"],
-        ["close tab", "tab-close"],
-        ["close this tab", "tab-close"],
-        ["next tab", "tab-next"],
-        ["tab right", "tab-next"],
-        ["last tab", "tab-prev"],
-        ["previous tab", "tab-prev"],
-        ["tab left", "tab-prev"],
-        ["undo tab", "undo"],
-        ["restore tab", "undo"],
-        ["reopen tab", "undo"],
-    ],
-)
-@patch.object(browser, "qb")
-def test_handle_browser_command_tabs(mock_qb, command, qb_command, mock_core):
-    """Test handling tab commands."""
-    result = browser.handle_browser_command(command, mock_core)
-
-    assert result is True
-    assert mock_qb.called
-    assert mock_qb.call_args.args[0] == qb_command
-
-
-@pytest.mark.parametrize(
-    ["command", "expected_tab"],
-    [
-        ["tab one", "1"],
-        ["tab two", "2"],
-        ["tab five", "5"],
-        ["tab 3", "3"],
-    ],
-)
-@patch.object(browser, "qb")
-def test_handle_browser_command_tab_switch(mock_qb, command, expected_tab, mock_core):
-    """Test switching to specific tab by number."""
-    result = browser.handle_browser_command(command, mock_core)
-
-    assert result is True
-    assert mock_qb.called
-    assert mock_qb.call_args.args[0] == f"tab-focus {expected_tab}"
-
-
-@pytest.mark.parametrize(
-    ["command", "query"],
+    ["site", "url"],
     [
-        ["find test", "test"],
-        ["find hello world", "hello world"],
+        ("youtube", "https://youtube.com"),
+        ("google", "https://google.com"),
+        ("gmail", "https://mail.google.com"),
+        ("github", "https://github.com"),
+        ("reddit", "https://reddit.com"),
+        ("twitter", "https://twitter.com"),
+        ("facebook", "https://facebook.com"),
+        ("amazon", "https://amazon.com"),
+        ("netflix", "https://netflix.com"),
+        ("duckduckgo", "https://duckduckgo.com"),
+        ("duck", "https://duckduckgo.com"),
     ],
 )
-@patch.object(browser, "qb")
-def test_handle_browser_command_find(mock_qb, command, query, mock_core):
-    """Test handling find commands."""
-    result = browser.handle_browser_command(command, mock_core)
-
-    assert result is True
-    assert mock_qb.called
-    assert mock_qb.call_args.args[0] == f"search {query}"
-
-
-@pytest.mark.parametrize(
-    ["command", "query"],
-    [
-        ["find next", "next"],  # "find next" is treated as search for "next"
-        [
-            "find previous",
-            "previous",
-        ],  # "find previous" is treated as search for "previous"
-    ],
-)
-@patch.object(browser, "qb")
-def test_handle_browser_command_find_treated_as_search(
-    mock_qb, command, query, mock_core
-):
-    """Test that find next/previous are treated as search queries due to code logic."""
-    result = browser.handle_browser_command(command, mock_core)
-
-    assert result is True
-    assert mock_qb.called
-    assert mock_qb.call_args.args[0] == f"search {query}"
-
-
-@pytest.mark.parametrize(
-    ["command", "qb_command"],
-    [
-        ["next match", "search-next"],
-        ["previous match", "search-prev"],
-    ],
-)
-@patch.object(browser, "qb")
-def test_handle_browser_command_find_navigation(
-    mock_qb, command, qb_command, mock_core
-):
-    """Test handling find navigation commands that don't start with 'find'."""
-    result = browser.handle_browser_command(command, mock_core)
-
-    assert result is True
-    assert mock_qb.called
-    assert mock_qb.call_args.args[0] == qb_command
-
-
-@pytest.mark.parametrize(
-    "command",
-    [
-        "escape",
-        "cancel",
-        "nevermind",
-    ],
-)
-@patch.object(browser, "qb")
-def test_handle_browser_command_escape(mock_qb, command, mock_core):
-    """Test handling escape commands."""
-    result = browser.handle_browser_command(command, mock_core)
-
-    assert result is True
-    assert mock_qb.called
-    assert mock_qb.call_args.args[0] == "fake-key <Escape>"
-
-
-@pytest.mark.parametrize(
-    ["command", "site", "url"],
-    [
-        ["go to youtube", "youtube", "https://youtube.com"],
-        ["go to google", "google", "https://google.com"],
-        ["go to github", "github", "https://github.com"],
-        ["go to reddit", "reddit", "https://reddit.com"],
-        ["go to duck", "duck", "https://duckduckgo.com"],
-    ],
-)
-@patch.object(browser, "qb_open")
-def test_handle_browser_command_bookmarks(mock_qb_open, command, site, url, mock_core):
+def test_handle_browser_command_bookmarks(qutebrowser, site, url, mock_core):
     """Test handling bookmark navigation commands."""
-    result = browser.handle_browser_command(command, mock_core)
+    result = browser.handle_browser_command(f"go to {site}", mock_core)
 
     assert result is True
-    assert mock_qb_open.called
-    assert mock_qb_open.call_args.args[0] == url
+    assert qutebrowser.qb_open.called
+    assert qutebrowser.qb_open.call_args.args[0] == url
     assert mock_core.speak.call_count == 1
     assert mock_core.speak.call_args.args[0] == f"Opening {site}."
 
@@ -479,53 +396,50 @@ def test_handle_browser_command_bookmarks(mock_qb_open, command, site, url, mock
 @pytest.mark.parametrize(
     ["command", "expected_url"],
     [
-        ["go to claude dot ai", "https://claude.ai"],
-        ["go to example dot com", "https://example.com"],
-        ["open test dot org", "https://test.org"],
+        ("go to claude dot ai", "https://claude.ai"),
+        ("go to example dot com", "https://example.com"),
+        ("open test dot org", "https://test.org"),
     ],
 )
-@patch.object(browser, "qb_open")
 def test_handle_browser_command_spoken_url(
-    mock_qb_open, command, expected_url, mock_core
+    qutebrowser, command, expected_url, mock_core
 ):
     """Test handling spoken URL commands."""
     result = browser.handle_browser_command(command, mock_core)
 
     assert result is True
-    assert mock_qb_open.called
-    assert mock_qb_open.call_args.args[0] == expected_url
+    assert qutebrowser.qb_open.called
+    assert qutebrowser.qb_open.call_args.args[0] == expected_url
     assert mock_core.speak.call_count == 1
 
 
 @pytest.mark.parametrize(
     ["command", "query"],
     [
-        ["search test", "test"],
-        ["search for python tutorial", "python tutorial"],
-        ["search linux tips", "linux tips"],
+        ("search test", "test"),
+        ("search for python tutorial", "python tutorial"),
+        ("search linux tips", "linux tips"),
     ],
 )
-@patch.object(browser, "qb_open")
-def test_handle_browser_command_search(mock_qb_open, command, query, mock_core):
+def test_handle_browser_command_search(qutebrowser, command, query, mock_core):
     """Test handling search commands."""
     result = browser.handle_browser_command(command, mock_core)
 
     assert result is True
     expected_url = f"https://duckduckgo.com/?q={query.replace(' ', '+')}"
-    assert mock_qb_open.called
-    assert mock_qb_open.call_args.args[0] == expected_url
+    assert qutebrowser.qb_open.called
+    assert qutebrowser.qb_open.call_args.args[0] == expected_url
     assert mock_core.speak.call_count == 1
     assert mock_core.speak.call_args.args[0] == f"Searching for {query}."
 
 
-@patch.object(browser, "qb")
-def test_handle_browser_command_bookmark_save(mock_qb, mock_core):
+def test_handle_browser_command_bookmark_save(qutebrowser, mock_core):
     """Test saving bookmark command."""
     result = browser.handle_browser_command("bookmark this as mysite", mock_core)
 
     assert result is True
-    assert mock_qb.called
-    assert mock_qb.call_args.args[0] == "quickmark-save mysite"
+    assert qutebrowser.qb.called
+    assert qutebrowser.qb.call_args.args[0] == "quickmark-save mysite"
     assert mock_core.speak.call_count == 1
     assert mock_core.speak.call_args.args[0] == "Saved as mysite."
 
@@ -533,19 +447,20 @@ def test_handle_browser_command_bookmark_save(mock_qb, mock_core):
 @pytest.mark.parametrize(
     ["command", "hint"],
     [
-        ["02", "02"],
-        ["92", "92"],
-        ["o2", "02"],
+        ("02", "02"),
+        ("92", "92"),
+        ("o2", "02"),
     ],
 )
-@patch.object(browser, "qb")
-def test_handle_browser_command_direct_hint(mock_qb, command, hint, mock_core, readlog):
+def test_handle_browser_command_direct_hint(
+    qutebrowser, command, hint, mock_core, readlog
+):
     """Test handling direct hint number input."""
     result = browser.handle_browser_command(command, mock_core)
 
     assert result is True
-    assert mock_qb.called
-    assert mock_qb.call_args.args[0] == f"hint-follow {hint}"
+    assert qutebrowser.qb.called
+    assert qutebrowser.qb.call_args.args[0] == f"hint-follow {hint}"
     captured = readlog()
     assert "Direct digits" in captured.out
 
@@ -572,6 +487,17 @@ def test_setup(mock_ensure, mock_core):
 # Tests for handle function.
 
 
+@pytest.fixture
+def handoff(stub_attrs):
+    """Stand-ins for the two places handle() passes a command on to.
+
+    Replaces per-test ``@patch.object`` stacks for browser_mode and
+    handle_browser_command; a test sets ``return_value`` or ``side_effect`` on
+    the stub it cares about.
+    """
+    return stub_attrs(browser, browser_mode=Mock(), handle_browser_command=Mock())
+
+
 @pytest.mark.parametrize(
     "command",
     [
@@ -582,8 +508,7 @@ def test_setup(mock_ensure, mock_core):
     ],
 )
 @patch.object(browser, "_qutebrowser_running", return_value=False)
-@patch.object(browser, "browser_mode")
-def test_handle_browser_mode(mock_browser_mode, mock_running, command, mock_core):
+def test_handle_browser_mode(mock_running, handoff, command, mock_core):
     """Test handle function for entering browser mode."""
     result = browser.handle(command, mock_core)
 
@@ -592,26 +517,22 @@ def test_handle_browser_mode(mock_browser_mode, mock_running, command, mock_core
     call_args = mock_core.host_run.call_args
     assert call_args.args[0] == ["qutebrowser"]
     assert call_args.kwargs["background"] is True
-    assert mock_browser_mode.called
-    assert mock_browser_mode.call_args.args[0] == mock_core
+    assert handoff.browser_mode.called
+    assert handoff.browser_mode.call_args.args[0] == mock_core
 
 
-@patch.object(browser, "handle_browser_command")
-@patch.object(browser, "browser_mode")
-def test_handle_browser_command_enters_mode(
-    mock_browser_mode, mock_handle_cmd, mock_core
-):
+def test_handle_browser_command_enters_mode(handoff, mock_core):
     """Test handle function enters browser mode after single command."""
     mock_core.host_run.return_value = Mock(returncode=0)
-    mock_handle_cmd.return_value = True
+    handoff.handle_browser_command.return_value = True
 
     result = browser.handle("back", mock_core)
 
     assert result is True
-    assert mock_handle_cmd.called
-    assert mock_handle_cmd.call_args.args == ("back", mock_core)
-    assert mock_browser_mode.called
-    assert mock_browser_mode.call_args.args[0] == mock_core
+    assert handoff.handle_browser_command.called
+    assert handoff.handle_browser_command.call_args.args == ("back", mock_core)
+    assert handoff.browser_mode.called
+    assert handoff.browser_mode.call_args.args[0] == mock_core
 
 
 @pytest.mark.parametrize(
@@ -625,36 +546,30 @@ def test_handle_browser_command_enters_mode(
         "stop listening now",
     ],
 )
-@patch.object(browser, "handle_browser_command")
-def test_handle_declines_reserved_global_commands(mock_handle_cmd, command, mock_core):
+def test_handle_declines_reserved_global_commands(handoff, command, mock_core):
     """Sleep/quit phrases fall through (return None) without being treated as
     browser commands — otherwise qb() would open a qutebrowser window."""
     result = browser.handle(command, mock_core)
 
     assert result is None
-    mock_handle_cmd.assert_not_called()
+    handoff.handle_browser_command.assert_not_called()
     mock_core.host_run.assert_not_called()
 
 
-@patch.object(browser, "handle_browser_command")
-def test_handle_unmatched_command(mock_handle_cmd, mock_core):
+def test_handle_unmatched_command(handoff, mock_core):
     """A running browser plus an unrecognised command falls through to None."""
     mock_core.host_run.return_value = Mock(returncode=0)
-    mock_handle_cmd.return_value = None
+    handoff.handle_browser_command.return_value = None
 
     result = browser.handle("unrelated command", mock_core)
 
     assert result is None
 
 
-@patch.object(browser, "handle_browser_command")
-@patch.object(browser, "browser_mode")
-def test_handle_browser_command_exception(
-    mock_browser_mode, mock_handle_cmd, mock_core, readlog
-):
+def test_handle_browser_command_exception(handoff, mock_core, readlog):
     """Test handle function handles exceptions gracefully."""
     mock_core.host_run.return_value = Mock(returncode=0)
-    mock_handle_cmd.side_effect = Exception("Test error")
+    handoff.handle_browser_command.side_effect = Exception("Test error")
 
     result = browser.handle("back", mock_core)
 
@@ -670,11 +585,7 @@ def test_handle_browser_command_exception(
     "command",
     ["back", "down", "up", "top", "bottom", "reload", "02", "one"],
 )
-@patch.object(browser, "browser_mode")
-@patch.object(browser, "handle_browser_command")
-def test_handle_ignores_navigation_when_no_browser_running(
-    mock_handle_cmd, mock_browser_mode, command, mock_core
-):
+def test_handle_ignores_navigation_when_no_browser_running(handoff, command, mock_core):
     """With no browser running, an ambiguous navigation word falls through
     instead of launching qutebrowser and trapping the user in browser mode.
 
@@ -685,35 +596,29 @@ def test_handle_ignores_navigation_when_no_browser_running(
     result = browser.handle(command, mock_core)
 
     assert result is None
-    mock_handle_cmd.assert_not_called()
-    mock_browser_mode.assert_not_called()
+    handoff.handle_browser_command.assert_not_called()
+    handoff.browser_mode.assert_not_called()
     assert mock_core.host_run.call_count == 1
     assert mock_core.host_run.call_args.args[0] == ["pgrep", "-f", "qutebrowser"]
 
 
-@patch.object(browser, "browser_mode")
-@patch.object(browser, "handle_browser_command", return_value=True)
-def test_handle_acts_on_navigation_when_browser_running(
-    mock_handle_cmd, mock_browser_mode, mock_core
-):
+def test_handle_acts_on_navigation_when_browser_running(handoff, mock_core):
     """With a browser running, a navigation word is handled as before."""
+    handoff.handle_browser_command.return_value = True
     mock_core.host_run.return_value = Mock(returncode=0)
 
     result = browser.handle("back", mock_core)
 
     assert result is True
-    mock_handle_cmd.assert_called_once_with("back", mock_core)
-    mock_browser_mode.assert_called_once_with(mock_core)
+    handoff.handle_browser_command.assert_called_once_with("back", mock_core)
+    handoff.browser_mode.assert_called_once_with(mock_core)
 
 
 @pytest.mark.parametrize(
     "command",
     ["browser", "browser mode", "open browser", "launch browser"],
 )
-@patch.object(browser, "browser_mode")
-def test_handle_explicit_launch_bypasses_running_check(
-    mock_browser_mode, command, mock_core
-):
+def test_handle_explicit_launch_bypasses_running_check(handoff, command, mock_core):
     """Explicit "open browser" launches qutebrowser even when none is running."""
     mock_core.host_run.return_value = Mock(returncode=1)
 
@@ -724,7 +629,7 @@ def test_handle_explicit_launch_bypasses_running_check(
         c for c in mock_core.host_run.call_args_list if c.args[0] == ["qutebrowser"]
     ]
     assert len(launch_calls) == 1
-    mock_browser_mode.assert_called_once_with(mock_core)
+    handoff.browser_mode.assert_called_once_with(mock_core)
 
 
 @pytest.mark.parametrize("returncode, expected", [(0, True), (1, False)])
@@ -960,7 +865,9 @@ def test_browser_mode_no_transcription_continue(
     ],
 )
 @patch.object(browser, "handle_browser_command")
-def test_browser_mode_exit(mock_handle_cmd, exit_command, mock_core_factory, readlog):
+def test_browser_mode_exit(
+    mock_handle_cmd, qutebrowser, exit_command, mock_core_factory, readlog
+):
     """When exit browser command is spoken, browser_mode exits."""
     mock_core = mock_core_factory(
         wait_for_speech_values=[b"audio"], transcribe_values=[exit_command]
@@ -1037,43 +944,41 @@ def test_browser_mode_audio_buffer_exception(
 # Additional tests for handle_browser_command coverage.
 
 
-@patch.object(browser, "qb")
-def test_handle_browser_command_quickmark_load(mock_qb, mock_core):
+def test_handle_browser_command_quickmark_load(qutebrowser, mock_core):
     """When 'go to' with unknown bookmark, quickmark-load is used."""
     result = browser.handle_browser_command("go to mysite", mock_core)
 
     assert result is True
-    assert mock_qb.called
-    assert mock_qb.call_args.args[0] == "quickmark-load mysite"
+    assert qutebrowser.qb.called
+    assert qutebrowser.qb.call_args.args[0] == "quickmark-load mysite"
 
 
-@patch.object(browser, "qb_open")
-def test_handle_browser_command_open_returns_none(mock_qb_open, mock_core):
+def test_handle_browser_command_open_returns_none(qutebrowser, mock_core):
     """When 'open' without 'go to' prefix, returns None to let other plugins handle."""
     result = browser.handle_browser_command("open myapp", mock_core)
 
     assert result is None
-    assert not mock_qb_open.called
+    assert not qutebrowser.qb_open.called
 
 
-@patch.object(browser, "qb")
-def test_handle_browser_command_phonetic_hint_not_digit(mock_qb, mock_core, readlog):
+def test_handle_browser_command_phonetic_hint_not_digit(
+    qutebrowser, mock_core, readlog
+):
     """When looks_like_hint but phonetic parsing fails, returns None."""
     result = browser.handle_browser_command("xy", mock_core)
 
     assert result is None
-    assert not mock_qb.called
+    assert not qutebrowser.qb.called
 
 
-@patch.object(browser, "qb")
-def test_handle_browser_command_phonetic_hint_parsing(mock_qb, mock_core, readlog):
+def test_handle_browser_command_phonetic_hint_parsing(qutebrowser, mock_core, readlog):
     """When looks_like_hint and phonetic parsing succeeds, hint is followed."""
     # Use a short command with number words that looks like a hint
     result = browser.handle_browser_command("one", mock_core)
 
     assert result is True
-    assert mock_qb.called
-    assert mock_qb.call_args.args[0] == "hint-follow 1"
+    assert qutebrowser.qb.called
+    assert qutebrowser.qb.call_args.args[0] == "hint-follow 1"
     captured = readlog()
     assert "Phonetic parsed:" in captured.out
 
@@ -1254,16 +1159,15 @@ def test_browser_mode_leave_keeps_the_browser(mock_qb, command, mock_core_factor
 
 
 @pytest.mark.parametrize("command", ["close browser", "quit browser"])
-@patch.object(browser, "browser_mode")
 @patch.object(browser, "_qutebrowser_running", return_value=True)
 @patch.object(browser, "qb")
 def test_handle_closes_the_browser_without_entering_mode(
-    mock_qb, mock_running, mock_browser_mode, command, mock_core
+    mock_qb, mock_running, handoff, command, mock_core
 ):
     """When closing the browser from outside then no mode is entered."""
     assert browser.handle(command, mock_core) is True
     assert mock_qb.call_args.args[0] == "quit"
-    assert not mock_browser_mode.called
+    assert not handoff.browser_mode.called
 
 
 @patch.object(browser, "_qutebrowser_running", return_value=False)
@@ -1275,17 +1179,14 @@ def test_handle_close_reports_when_not_running(mock_qb, mock_running, mock_core)
     assert not mock_qb.called
 
 
-@patch.object(browser, "browser_mode")
 @patch.object(browser, "_qutebrowser_running", return_value=True)
-def test_handle_absorbs_a_stale_leave_command(
-    mock_running, mock_browser_mode, mock_core
-):
+def test_handle_absorbs_a_stale_leave_command(mock_running, handoff, mock_core):
     """When already outside browser mode then "exit browser" is not an error.
 
     It used to fall through every plugin and land on "Sorry, I didn't understand."
     """
     assert browser.handle("exit browser", mock_core) is True
-    assert not mock_browser_mode.called
+    assert not handoff.browser_mode.called
 
 
 @patch.object(browser, "handle_browser_command", return_value=True)
@@ -1302,10 +1203,9 @@ def test_browser_mode_keeps_going_after_a_browser_command(
 
 
 @pytest.mark.parametrize("command", ["browser", "open browser"])
-@patch.object(browser, "browser_mode")
 @patch.object(browser, "_qutebrowser_running", return_value=True)
 def test_handle_does_not_relaunch_a_running_browser(
-    mock_running, mock_browser_mode, command, mock_core
+    mock_running, handoff, command, mock_core
 ):
     """When a browser is already up then entering the mode must not disturb it.
 
@@ -1322,14 +1222,11 @@ def test_handle_does_not_relaunch_a_running_browser(
         if call.args[0][0] == "qutebrowser"
     ]
     assert launches == []
-    assert mock_browser_mode.called
+    assert handoff.browser_mode.called
 
 
-@patch.object(browser, "browser_mode")
 @patch.object(browser, "_qutebrowser_running", return_value=False)
-def test_handle_launches_with_a_clean_environment(
-    mock_running, mock_browser_mode, mock_core
-):
+def test_handle_launches_with_a_clean_environment(mock_running, handoff, mock_core):
     """A launched browser must not inherit EasySpeak's own library paths."""
     browser.handle("open browser", mock_core)
 
@@ -1337,8 +1234,7 @@ def test_handle_launches_with_a_clean_environment(
 
 
 @pytest.mark.parametrize("command", ["browser", "browser mode", "open browser"])
-@patch.object(browser, "browser_mode")
-def test_handle_does_not_nest_browser_mode(mock_browser_mode, command, mock_core):
+def test_handle_does_not_nest_browser_mode(handoff, command, mock_core):
     """Saying "browser" while already in browser mode must not stack another.
 
     Commands this plugin doesn't own are handed back to the daemon, and "browser"
@@ -1349,7 +1245,7 @@ def test_handle_does_not_nest_browser_mode(mock_browser_mode, command, mock_core
 
     assert browser.handle(command, mock_core) is True
 
-    assert not mock_browser_mode.called
+    assert not handoff.browser_mode.called
     assert not mock_core.host_run.called
 
 
@@ -1506,10 +1402,8 @@ def _forget_navigation(mock_core):
 
 @pytest.mark.parametrize("command", ["back", "go back", "forward", "next page"])
 @patch("time.sleep")
-@patch.object(browser, "listen_for_hint")
-@patch.object(browser, "qb")
 def test_hints_reload_after_a_history_navigation(
-    mock_qb, mock_listen, mock_sleep, command, mock_core
+    mock_sleep, qutebrowser, command, mock_core
 ):
     """Going back leaves the page unhintable until it genuinely loads again.
 
@@ -1521,34 +1415,28 @@ def test_hints_reload_after_a_history_navigation(
     browser.handle_browser_command(command, mock_core)
     browser.handle_browser_command("numbers", mock_core)
 
-    sent = [call.args[0] for call in mock_qb.call_args_list]
+    sent = [call.args[0] for call in qutebrowser.qb.call_args_list]
     assert sent.index("reload") < sent.index("hint")
 
 
 @patch("time.sleep")
-@patch.object(browser, "listen_for_hint")
-@patch.object(browser, "qb")
-def test_hints_do_not_reload_without_a_navigation(
-    mock_qb, mock_listen, mock_sleep, mock_core
-):
+def test_hints_do_not_reload_without_a_navigation(mock_sleep, qutebrowser, mock_core):
     """A page that loaded normally is hintable, so don't throw it away."""
     browser.handle_browser_command("numbers", mock_core)
 
-    assert "reload" not in [call.args[0] for call in mock_qb.call_args_list]
+    assert "reload" not in [call.args[0] for call in qutebrowser.qb.call_args_list]
 
 
 @patch("time.sleep")
-@patch.object(browser, "listen_for_hint")
-@patch.object(browser, "qb")
-def test_the_reload_happens_only_once(mock_qb, mock_listen, mock_sleep, mock_core):
+def test_the_reload_happens_only_once(mock_sleep, qutebrowser, mock_core):
     """One reload restores hinting; asking again shouldn't reload afresh."""
     browser.handle_browser_command("back", mock_core)
     browser.handle_browser_command("numbers", mock_core)
-    mock_qb.reset_mock()
+    qutebrowser.qb.reset_mock()
 
     browser.handle_browser_command("numbers", mock_core)
 
-    assert "reload" not in [call.args[0] for call in mock_qb.call_args_list]
+    assert "reload" not in [call.args[0] for call in qutebrowser.qb.call_args_list]
 
 
 @patch("time.sleep")
@@ -1583,14 +1471,15 @@ def test_show_hints_settles_before_hinting(mock_qb, mock_sleep, mock_core):
         ("close tab", ["tab-close"]),
     ],
 )
-@patch.object(browser, "qb")
-def test_tab_commands_accept_natural_phrasings(mock_qb, command, expected, mock_core):
+def test_tab_commands_accept_natural_phrasings(
+    qutebrowser, command, expected, mock_core
+):
     """There is no reason to make someone remember which phrasing was implemented.
 
     "go to tab 2" in particular used to be read as a bookmark named "tab 2".
     """
     assert browser.handle_browser_command(command, mock_core) is True
-    assert [call.args[0] for call in mock_qb.call_args_list] == expected
+    assert [call.args[0] for call in qutebrowser.qb.call_args_list] == expected
 
 
 @pytest.mark.parametrize(
@@ -1602,23 +1491,21 @@ def test_tab_commands_accept_natural_phrasings(mock_qb, command, expected, mock_
         ("okay top", "jseval"),
     ],
 )
-@patch.object(browser, "qb")
-def test_a_filler_word_does_not_lose_the_command(mock_qb, spoken, bare, mock_core):
+def test_a_filler_word_does_not_lose_the_command(qutebrowser, spoken, bare, mock_core):
     """Whisper prefixes commands with words the user didn't emphasise.
 
     Answering "I didn't understand" to "and scroll down" is a poor result for a
     perfectly clear instruction.
     """
     assert browser.handle_browser_command(spoken, mock_core) is True
-    assert bare in mock_qb.call_args.args[0]
+    assert bare in qutebrowser.qb.call_args.args[0]
 
 
 @pytest.mark.parametrize("command", ["exit links", "exit link"])
-@patch.object(browser, "qb")
-def test_a_stray_hint_phrase_is_absorbed(mock_qb, command, mock_core):
+def test_a_stray_hint_phrase_is_absorbed(qutebrowser, command, mock_core):
     """Said a beat after hint mode closed, and owned by this plugin either way."""
     assert browser.handle_browser_command(command, mock_core) is True
-    assert not mock_qb.called
+    assert not qutebrowser.qb.called
 
 
 # --- Saying what just happened ------------------------------------------------
@@ -1684,9 +1571,7 @@ def test_a_page_without_hints_is_announced(mock_qb, mock_sleep, mock_core_factor
 
 
 @patch("time.sleep")
-@patch.object(browser, "listen_for_hint")
-@patch.object(browser, "qb")
-def test_the_reload_is_announced(mock_qb, mock_listen, mock_sleep, mock_core):
+def test_the_reload_is_announced(mock_sleep, qutebrowser, mock_core):
     """A reload is a pause with no explanation unless one is given."""
     browser.handle_browser_command("back", mock_core)
     browser.handle_browser_command("numbers", mock_core)
@@ -1696,9 +1581,8 @@ def test_the_reload_is_announced(mock_qb, mock_listen, mock_sleep, mock_core):
 
 @pytest.mark.parametrize("command", ["scroll down", "scroll up", "top", "bottom"])
 @patch("time.sleep")
-@patch.object(browser, "qb")
 def test_scrolling_reloads_after_a_history_navigation(
-    mock_qb, mock_sleep, command, mock_core
+    mock_sleep, qutebrowser, command, mock_core
 ):
     """Scrolling runs JavaScript too, and a restored page has none of it.
 
@@ -1708,39 +1592,36 @@ def test_scrolling_reloads_after_a_history_navigation(
     browser.handle_browser_command("back", mock_core)
     browser.handle_browser_command(command, mock_core)
 
-    sent = [call.args[0] for call in mock_qb.call_args_list]
+    sent = [call.args[0] for call in qutebrowser.qb.call_args_list]
     assert sent.index("reload") < next(
         i for i, cmd in enumerate(sent) if cmd.startswith("jseval")
     )
 
 
 @patch("time.sleep")
-@patch.object(browser, "qb")
-def test_scrolling_reloads_only_once(mock_qb, mock_sleep, mock_core):
+def test_scrolling_reloads_only_once(mock_sleep, qutebrowser, mock_core):
     """One reload restores the page's scripts for hinting and scrolling alike."""
     browser.handle_browser_command("back", mock_core)
     browser.handle_browser_command("scroll down", mock_core)
-    mock_qb.reset_mock()
+    qutebrowser.qb.reset_mock()
 
     browser.handle_browser_command("scroll down", mock_core)
 
-    assert "reload" not in [call.args[0] for call in mock_qb.call_args_list]
+    assert "reload" not in [call.args[0] for call in qutebrowser.qb.call_args_list]
 
 
 @patch("time.sleep")
-@patch.object(browser, "listen_for_hint")
-@patch.object(browser, "qb")
 def test_one_reload_serves_both_hinting_and_scrolling(
-    mock_qb, mock_listen, mock_sleep, mock_core
+    mock_sleep, qutebrowser, mock_core
 ):
     """Scrolling after a back shouldn't leave hinting to reload all over again."""
     browser.handle_browser_command("back", mock_core)
     browser.handle_browser_command("scroll down", mock_core)
-    mock_qb.reset_mock()
+    qutebrowser.qb.reset_mock()
 
     browser.handle_browser_command("numbers", mock_core)
 
-    assert "reload" not in [call.args[0] for call in mock_qb.call_args_list]
+    assert "reload" not in [call.args[0] for call in qutebrowser.qb.call_args_list]
 
 
 @pytest.mark.parametrize(
@@ -1821,11 +1702,7 @@ def test_setup_declares_the_page_state(mock_config, mock_core):
 
 
 @patch("time.sleep")
-@patch.object(browser, "listen_for_hint")
-@patch.object(browser, "qb")
-def test_page_state_belongs_to_the_session(
-    mock_qb, mock_listen, mock_sleep, mock_core_factory
-):
+def test_page_state_belongs_to_the_session(mock_sleep, qutebrowser, mock_core_factory):
     """One session navigating must not make another session reload.
 
     This used to be a module-level flag, so it was shared by everything.
@@ -1835,10 +1712,10 @@ def test_page_state_belongs_to_the_session(
     second.browser_page_js_stale = False
 
     browser.handle_browser_command("back", first)
-    mock_qb.reset_mock()
+    qutebrowser.qb.reset_mock()
     browser.handle_browser_command("numbers", second)
 
-    assert "reload" not in [call.args[0] for call in mock_qb.call_args_list]
+    assert "reload" not in [call.args[0] for call in qutebrowser.qb.call_args_list]
     assert first.browser_page_js_stale is True
 
 
@@ -1861,7 +1738,9 @@ def test_browser_sends_keystrokes(mock_press, command, key, mock_core):
 
 @pytest.mark.parametrize("command", ["down", "up", "tab", "escape"])
 @patch.object(mediakeys, "press_key")
-def test_browser_words_keep_their_own_meaning(mock_press, command, mock_core):
+def test_browser_words_keep_their_own_meaning(
+    mock_press, qutebrowser, command, mock_core
+):
     """Words that already mean something in this mode are not treated as keys."""
     browser.handle_browser_command(command, mock_core)
 
@@ -1912,28 +1791,25 @@ def test_software_rendering_is_not_added_twice(tmp_path, monkeypatch):
     assert cfg.read_text().count(browser.SOFTWARE_RENDERING_LINE) == 1
 
 
-@patch.object(browser, "qb")
 @patch.object(browser, "set_config_line", return_value=True)
-def test_fix_rendering_restarts_the_browser(mock_set, mock_qb, mock_core):
+def test_fix_rendering_restarts_the_browser(mock_set, qutebrowser, mock_core):
     """The setting only applies on a fresh qutebrowser process."""
     assert browser.handle_browser_command("fix rendering", mock_core) is True
     assert mock_set.call_args.args[0] == browser.SOFTWARE_RENDERING_LINE
-    assert mock_qb.call_args.args[0] == "restart"
+    assert qutebrowser.qb.call_args.args[0] == "restart"
 
 
-@patch.object(browser, "qb")
 @patch.object(browser, "set_config_line", return_value=None)
-def test_rendering_reports_an_unwritable_config(mock_set, mock_qb, mock_core):
+def test_rendering_reports_an_unwritable_config(mock_set, qutebrowser, mock_core):
     """A read-only config is reported rather than silently ignored."""
     browser.handle_browser_command("fix rendering", mock_core)
 
-    assert not mock_qb.called
+    assert not qutebrowser.qb.called
     assert "Could not write" in mock_core.speak.call_args.args[0]
 
 
-@patch.object(browser, "qb")
 @patch.object(browser, "set_config_line", return_value=True)
-def test_restore_rendering_turns_the_line_off(mock_set, mock_qb, mock_core):
+def test_restore_rendering_turns_the_line_off(mock_set, qutebrowser, mock_core):
     """Going back to hardware rendering removes the software-rendering line."""
     assert browser.handle_browser_command("restore rendering", mock_core) is True
     assert mock_set.call_args.args[0] == browser.SOFTWARE_RENDERING_LINE
@@ -1960,11 +1836,10 @@ def test_set_config_line_reports_a_write_failure(tmp_path, monkeypatch, readlog)
         ("enable ad blocking", False),
     ],
 )
-@patch.object(browser, "qb")
 @patch.object(browser, "set_config_line", return_value=True)
-def test_adblock_toggle(mock_set, mock_qb, command, wanted, mock_core):
+def test_adblock_toggle(mock_set, qutebrowser, command, wanted, mock_core):
     """Ad blocking can be turned off for sites that fight it, and back on."""
     assert browser.handle_browser_command(command, mock_core) is True
     assert mock_set.call_args.args[0] == browser.ADBLOCK_OFF_LINE
     assert mock_set.call_args.kwargs["wanted"] is wanted
-    assert mock_qb.call_args.args[0] == "restart"
+    assert qutebrowser.qb.call_args.args[0] == "restart"
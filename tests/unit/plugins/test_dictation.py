@@ -1,6 +1,7 @@
 """Tests for the dictation plugin module."""
 
 import json
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
@@ -23,11 +24,12 @@ def _reset_atspi_interpreter():
 @patch.object(dictation, "ensure_gnome_accessibility")
 def test_setup(mock_ensure):
     """Test that setup correctly assigns the core object."""
-    mock_core = Mock()
+    core = SimpleNamespace()
 
-    dictation.setup(mock_core)
+    dictation.setup(core)
 
-    assert dictation.core == mock_core
+    assert dictation.core is core
+    assert core.dictation_last_length == 0
     mock_ensure.assert_called_once_with()
 
 
@@ -225,8 +227,19 @@ def test_format_text_edge_cases(input_text, expected_output):
     assert result == expected_output
 
 
-@patch("subprocess.run", return_value=Mock(returncode=0, stdout="OK\n", stderr=""))
-def test_insert_via_atspi_success(mock_run, monkeypatch):
+@pytest.fixture
+def helper_run(monkeypatch):
+    """Stand-in for the ``subprocess.run`` that launches the AT-SPI helper.
+
+    It reports success by default; tests swap in another ``return_value`` or a
+    ``side_effect`` for the outcome they need.
+    """
+    run = Mock(return_value=SimpleNamespace(returncode=0, stdout="OK\n", stderr=""))
+    monkeypatch.setattr(dictation.subprocess, "run", run)
+    return run
+
+
+def test_insert_via_atspi_success(helper_run, monkeypatch):
     """When text insertion succeeds the result should be INSERTED.
 
     EASYSPEAK_ATSPI_PYTHON is cleared so the default-interpreter fallback is
@@ -239,30 +252,31 @@ def test_insert_via_atspi_success(mock_run, monkeypatch):
 
     assert result == dictation.INSERTED
     # Two calls now: probing an interpreter, then running the helper in it.
-    assert mock_run.call_count == 2
-    call_args = mock_run.call_args.args[0]
+    assert helper_run.call_count == 2
+    call_args = helper_run.call_args.args[0]
     assert call_args[0] == "python3"
     assert call_args[1] == dictation.ATSPI_HELPER
     assert call_args[1].endswith("_atspi_insert.py")
     assert call_args[2] == "Hello world"
 
 
-@patch(
-    "subprocess.run", return_value=Mock(returncode=0, stdout="NO_FOCUS\n", stderr="")
-)
-def test_insert_via_atspi_no_focus(mock_run):
+def test_insert_via_atspi_no_focus(helper_run):
     """When no text field is focused the result should be NO_FOCUS."""
+    helper_run.return_value = SimpleNamespace(
+        returncode=0, stdout="NO_FOCUS\n", stderr=""
+    )
+
     result = dictation.insert_via_atspi("Hello world")
 
     assert result == dictation.NO_FOCUS
 
 
-@patch(
-    "subprocess.run",
-    return_value=Mock(returncode=0, stdout="NO_BACKEND\n", stderr="No module named gi"),
-)
-def test_insert_via_atspi_backend_missing(mock_run, readlog):
+def test_insert_via_atspi_backend_missing(helper_run, readlog):
     """When the helper reports a missing backend the result is BACKEND_ERROR."""
+    helper_run.return_value = SimpleNamespace(
+        returncode=0, stdout="NO_BACKEND\n", stderr="No module named gi"
+    )
+
     result = dictation.insert_via_atspi("Hello world")
 
     assert result == dictation.BACKEND_ERROR
@@ -270,12 +284,10 @@ def test_insert_via_atspi_backend_missing(mock_run, readlog):
 
 
 @patch.dict("os.environ", {"EASYSPEAK_ATSPI_PYTHON": "/opt/atspi/bin/python3"})
-@patch(
-    "subprocess.run",
-    return_value=Mock(returncode=1, stdout="", stderr="boom"),
-)
-def test_insert_via_atspi_helper_crash(mock_run, readlog):
+def test_insert_via_atspi_helper_crash(helper_run, readlog):
     """A non-zero exit from the helper is treated as a backend error."""
+    helper_run.return_value = SimpleNamespace(returncode=1, stdout="", stderr="boom")
+
     result = dictation.insert_via_atspi("Hello world")
 
     assert result == dictation.BACKEND_ERROR
@@ -283,9 +295,10 @@ def test_insert_via_atspi_helper_crash(mock_run, readlog):
 
 
 @patch.dict("os.environ", {"EASYSPEAK_ATSPI_PYTHON": "/opt/atspi/bin/python3"})
-@patch("subprocess.run", side_effect=OSError("no python3"))
-def test_insert_via_atspi_interpreter_missing(mock_run, readlog):
+def test_insert_via_atspi_interpreter_missing(helper_run, readlog):
     """When the interpreter can't even launch the result is BACKEND_ERROR."""
+    helper_run.side_effect = OSError("no python3")
+
     result = dictation.insert_via_atspi("Hello world")
 
     assert result == dictation.BACKEND_ERROR
@@ -293,21 +306,19 @@ def test_insert_via_atspi_interpreter_missing(mock_run, readlog):
 
 
 @patch.dict("os.environ", {"EASYSPEAK_ATSPI_PYTHON": "/opt/atspi/bin/python3"})
-@patch("subprocess.run", return_value=Mock(returncode=0, stdout="OK\n", stderr=""))
-def test_insert_via_atspi_uses_configured_interpreter(mock_run):
+def test_insert_via_atspi_uses_configured_interpreter(helper_run):
     """EASYSPEAK_ATSPI_PYTHON overrides the interpreter the helper runs in."""
     dictation.insert_via_atspi("Hello world")
 
-    assert mock_run.call_args.args[0][0] == "/opt/atspi/bin/python3"
+    assert helper_run.call_args.args[0][0] == "/opt/atspi/bin/python3"
 
 
-@patch("subprocess.run", return_value=Mock(returncode=0, stdout="OK\n", stderr=""))
-def test_insert_via_atspi_empty_string(mock_run):
+def test_insert_via_atspi_empty_string(helper_run):
     """When inserting an empty string the result should be INSERTED."""
     result = dictation.insert_via_atspi("")
 
     assert result == dictation.INSERTED
-    call_args = mock_run.call_args.args[0]
+    call_args = helper_run.call_args.args[0]
     assert call_args[2] == ""
 
 
@@ -356,17 +367,28 @@ def test_handle_enters_dictation_on_note_word(
     mock_core_with_audio.transcribe = Mock(return_value="stop notes")
 
     assert dictation.handle(command, mock_core_with_audio) is True
-    assert ("Dictation",) in [
-        call.args for call in mock_core_with_audio.speak.call_args_list
-    ]
+    mock_core_with_audio.speak.assert_any_call("Dictation")
+
+
+@pytest.fixture
+def dictation_io(stub_attrs):
+    """Stand-ins for formatting and inserting dictated text.
+
+    Formatting gives "Hello" and inserting succeeds unless a test says otherwise.
+    """
+    return stub_attrs(
+        dictation,
+        format_text=Mock(return_value="Hello"),
+        insert_text=Mock(return_value=dictation.INSERTED),
+    )
 
 
-@patch("easyspeak.plugins.dictation.insert_text", return_value=True)
-@patch("easyspeak.plugins.dictation.format_text", return_value=".")
 def test_handle_dictation_mode_no_space_before_punctuation(
-    mock_format, mock_insert, mock_core_factory
+    mock_core_factory, dictation_io
 ):
     """When formatted text starts with punctuation no space should be added."""
+    dictation_io.insert_text.return_value = True
+    dictation_io.format_text.return_value = "."
     mock_core = mock_core_factory(
         wait_for_speech_values=[b"audio1", b"audio2"],
         record_until_silence_value=b"audio_rest",
@@ -376,38 +398,30 @@ def test_handle_dictation_mode_no_space_before_punctuation(
     result = dictation.handle("notes", mock_core)
 
     assert result is True
-    assert mock_insert.call_count == 1
-    assert mock_insert.call_args.args == (".",)
+    assert dictation_io.insert_text.call_count == 1
+    assert dictation_io.insert_text.call_args.args == (".",)
 
 
-@patch("easyspeak.plugins.dictation.insert_text", return_value=dictation.NO_FOCUS)
-@patch("easyspeak.plugins.dictation.format_text", return_value="Hello")
-def test_handle_dictation_mode_no_focus(mock_format, mock_insert, mock_core_with_audio):
+def test_handle_dictation_mode_no_focus(mock_core_with_audio, dictation_io):
     """When no text field is focused a warning should be spoken."""
+    dictation_io.insert_text.return_value = dictation.NO_FOCUS
     mock_core_with_audio.transcribe = Mock(return_value="some text")
 
     result = dictation.handle("notes", mock_core_with_audio)
 
     assert result is True
-    assert ("No text field focused.",) in [
-        call.args for call in mock_core_with_audio.speak.call_args_list
-    ]
+    mock_core_with_audio.speak.assert_any_call("No text field focused.")
 
 
-@patch("easyspeak.plugins.dictation.insert_text", return_value=dictation.BACKEND_ERROR)
-@patch("easyspeak.plugins.dictation.format_text", return_value="Hello")
-def test_handle_dictation_mode_backend_error(
-    mock_format, mock_insert, mock_core_with_audio
-):
+def test_handle_dictation_mode_backend_error(mock_core_with_audio, dictation_io):
     """When the AT-SPI backend is unavailable a setup hint should be spoken."""
+    dictation_io.insert_text.return_value = dictation.BACKEND_ERROR
     mock_core_with_audio.transcribe = Mock(return_value="some text")
 
     result = dictation.handle("notes", mock_core_with_audio)
 
     assert result is True
-    assert ("Dictation isn't set up on this system.",) in [
-        call.args for call in mock_core_with_audio.speak.call_args_list
-    ]
+    mock_core_with_audio.speak.assert_any_call("Dictation isn't set up on this system.")
 
 
 @patch("easyspeak.plugins.dictation.insert_text")
@@ -452,9 +466,7 @@ def test_handle_dictation_mode_stop_phrases(
     result = dictation.handle("notes", mock_core_with_audio)
 
     assert result is True
-    assert ("Done",) in [
-        call.args for call in mock_core_with_audio.speak.call_args_list
-    ]
+    mock_core_with_audio.speak.assert_any_call("Done")
     assert not mock_insert.called
 
 
@@ -488,9 +500,7 @@ def test_setup_skips_registration_without_support(mock_ensure):
     dictation.setup(core)  # must not raise
 
 
-@patch("easyspeak.plugins.dictation.insert_text", return_value=dictation.INSERTED)
-@patch("easyspeak.plugins.dictation.format_text", return_value="Hello")
-def test_run_push_to_talk_inserts_until_released(mock_format, mock_insert):
+def test_run_push_to_talk_inserts_until_released(dictation_io):
     """While held, each utterance is formatted and inserted via AT-SPI."""
     core = Mock()
     core.wait_for_speech = Mock(return_value=b"audio1")
@@ -499,8 +509,8 @@ def test_run_push_to_talk_inserts_until_released(mock_format, mock_insert):
 
     dictation.run_push_to_talk(core, _holds(1))
 
-    assert mock_insert.call_count == 1
-    assert mock_insert.call_args.args == (" Hello",)
+    assert dictation_io.insert_text.call_count == 1
+    assert dictation_io.insert_text.call_args.args == (" Hello",)
     # The capture is gated on the held state so a release can cut it short.
     assert core.wait_for_speech.call_args.kwargs["should_continue"] is not None
     assert core.record_until_silence.call_args.kwargs["should_continue"] is not None
@@ -531,10 +541,9 @@ def test_run_push_to_talk_skips_empty_transcription(mock_insert):
     mock_insert.assert_not_called()
 
 
-@patch("easyspeak.plugins.dictation.insert_text", return_value=dictation.NO_FOCUS)
-@patch("easyspeak.plugins.dictation.format_text", return_value="Hello")
-def test_run_push_to_talk_no_focus_stops(mock_format, mock_insert):
+def test_run_push_to_talk_no_focus_stops(dictation_io):
     """No focused field is spoken once and ends the session."""
+    dictation_io.insert_text.return_value = dictation.NO_FOCUS
     core = Mock()
     core.wait_for_speech = Mock(return_value=b"audio1")
     core.record_until_silence = Mock(return_value=b"audio2")
@@ -545,10 +554,9 @@ def test_run_push_to_talk_no_focus_stops(mock_format, mock_insert):
     core.speak.assert_called_once_with("No text field focused.")
 
 
-@patch("easyspeak.plugins.dictation.insert_text", return_value=dictation.BACKEND_ERROR)
-@patch("easyspeak.plugins.dictation.format_text", return_value="Hello")
-def test_run_push_to_talk_backend_error_stops(mock_format, mock_insert):
+def test_run_push_to_talk_backend_error_stops(dictation_io):
     """A backend error gives the setup hint once and ends the session."""
+    dictation_io.insert_text.return_value = dictation.BACKEND_ERROR
     core = Mock()
     core.wait_for_speech = Mock(return_value=b"audio1")
     core.record_until_silence = Mock(return_value=b"audio2")
@@ -559,14 +567,13 @@ def test_run_push_to_talk_backend_error_stops(mock_format, mock_insert):
     core.speak.assert_called_once_with("Dictation isn't set up on this system.")
 
 
-@patch("easyspeak.plugins.dictation.insert_text")
-@patch("easyspeak.plugins.dictation.format_text", return_value="")
-def test_dictate_utterance_noop_on_empty_format(mock_format, mock_insert):
+def test_dictate_utterance_noop_on_empty_format(dictation_io):
     """Text that formats to nothing inserts nothing and keeps dictating."""
+    dictation_io.format_text.return_value = ""
     core = Mock()
 
     assert dictation._dictate_utterance(core, "   ") is False
-    mock_insert.assert_not_called()
+    dictation_io.insert_text.assert_not_called()
 
 
 def test_handle_dictation_mode_ends_when_core_stops(mock_core_with_audio):
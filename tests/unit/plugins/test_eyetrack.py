@@ -1,30 +1,62 @@
 """Tests for the eyetrack (head tracking) plugin module."""
 
 import importlib
-import time
+import threading
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
 eyetrack_plugin = importlib.import_module("easyspeak.plugins.00_eyetrack")
 
+# Every call to the Shell extension starts like this; only the method differs.
+GDBUS_CALL = [
+    "gdbus",
+    "call",
+    "--session",
+    "--dest",
+    "org.gnome.Shell",
+    "--object-path",
+    "/org/easyspeak/Desktop",
+    "--method",
+]
+
 
 @pytest.fixture(autouse=True)
-def reset_eyetrack_state():
-    """Reset eyetrack plugin global state before and after each test."""
-    # Reset to clean state before test
-    eyetrack_plugin.tracking_active = False
-    eyetrack_plugin.frozen = False
-    eyetrack_plugin.stop_event.clear()
+def reset_eyetrack_state(monkeypatch):
+    """Give each test fresh plugin globals and put the originals back after.
+
+    monkeypatch restores them however the test ends, and a new stop_event per
+    test means no test can see another's signal.
+    """
+    monkeypatch.setattr(eyetrack_plugin, "core", None)
+    monkeypatch.setattr(eyetrack_plugin, "tracking_active", False)
+    monkeypatch.setattr(eyetrack_plugin, "tracking_thread", None)
+    monkeypatch.setattr(eyetrack_plugin, "stop_event", threading.Event())
+    monkeypatch.setattr(eyetrack_plugin, "cursor_x", eyetrack_plugin.cursor_x)
+    monkeypatch.setattr(eyetrack_plugin, "cursor_y", eyetrack_plugin.cursor_y)
+    monkeypatch.setattr(eyetrack_plugin, "frozen", False)
 
     yield
 
-    # Cleanup after test
-    eyetrack_plugin.tracking_active = False
-    eyetrack_plugin.frozen = False
+    # Stop a thread the test started and wait for it to actually exit.
     eyetrack_plugin.stop_event.set()
     if eyetrack_plugin.tracking_thread is not None:
-        time.sleep(0.1)  # Give thread time to stop
+        eyetrack_plugin.tracking_thread.join(timeout=1)
+
+
+@pytest.fixture(autouse=True)
+def skip_sleeps(monkeypatch):
+    """Make the plugin's waits return at once.
+
+    stop_tracking and recalibrate pause for the thread to wind down and the
+    tracking loop paces itself at ~30fps; none of it is real time under test.
+    Only the plugin's own ``time`` name is replaced (sleep is all it uses), so
+    time.sleep stays real for the rest of the process.
+    """
+    monkeypatch.setattr(
+        eyetrack_plugin, "time", SimpleNamespace(sleep=lambda _seconds: None)
+    )
 
 
 def test_setup(mock_core):
@@ -66,14 +98,7 @@ def test_dbus_call(mock_host_run, method, args, expected_returncode, expected_re
 
     assert result == expected_result
     call_args = mock_host_run.call_args.args[0]
-    assert call_args[0] == "gdbus"
-    assert call_args[1] == "call"
-    assert call_args[2] == "--session"
-    assert call_args[3] == "--dest"
-    assert call_args[4] == "org.gnome.Shell"
-    assert call_args[5] == "--object-path"
-    assert call_args[6] == "/org/easyspeak/Desktop"
-    assert call_args[7] == "--method"
+    assert call_args[:8] == GDBUS_CALL
     assert call_args[8] == f"org.easyspeak.Desktop.{method}"
     assert call_args[9:] == [str(a) for a in args]
 
@@ -96,11 +121,10 @@ def test_get_screen_size(mock_host_run, stdout, expected_size):
     result = eyetrack_plugin.get_screen_size()
 
     assert result == expected_size
-    call_args = mock_host_run.call_args.args[0]
-    assert call_args[0] == "gdbus"
-    assert call_args[4] == "org.gnome.Shell"
-    assert call_args[6] == "/org/easyspeak/Desktop"
-    assert call_args[8] == "org.easyspeak.Desktop.GetScreenSize"
+    assert mock_host_run.call_args.args[0] == [
+        *GDBUS_CALL,
+        "org.easyspeak.Desktop.GetScreenSize",
+    ]
 
 
 @patch.object(eyetrack_plugin, "host_run", return_value=Mock(returncode=1, stdout=""))
@@ -176,11 +200,11 @@ def test_recalibrate_when_not_tracking():
 
 
 @pytest.mark.parametrize(
-    ["command"],
+    "command",
     [
-        ["start tracking"],
-        ["begin tracking"],
-        ["enable tracking"],
+        "start tracking",
+        "begin tracking",
+        "enable tracking",
     ],
 )
 @patch.object(eyetrack_plugin, "listen_for_tracking_commands")
@@ -196,15 +220,15 @@ def test_handle_start_tracking_commands(mock_start, mock_listen, command, mock_c
 
 
 @pytest.mark.parametrize(
-    ["command"],
+    "command",
     [
-        ["stop tracking"],
-        ["end tracking"],
-        ["close tracking"],
-        ["quit tracking"],
-        ["disable tracking"],
-        ["tracking off"],
-        ["stop track"],
+        "stop tracking",
+        "end tracking",
+        "close tracking",
+        "quit tracking",
+        "disable tracking",
+        "tracking off",
+        "stop track",
     ],
 )
 @patch.object(eyetrack_plugin, "stop_tracking", return_value=(True, "Stopped"))
@@ -218,10 +242,10 @@ def test_handle_stop_tracking_commands(mock_stop, command, mock_core):
 
 
 @pytest.mark.parametrize(
-    ["command"],
+    "command",
     [
-        ["recalibrate"],
-        ["calibrate"],
+        "recalibrate",
+        "calibrate",
     ],
 )
 @patch.object(eyetrack_plugin, "recalibrate", return_value=(True, "Recalibrating"))
@@ -282,10 +306,11 @@ def test_one_euro_filter_multiple_calls_converge():
     filter_obj = eyetrack_plugin.OneEuroFilter()
 
     filter_obj(0.0)
-    for _ in range(100):
-        result = filter_obj(10.0)
+    # With the defaults it is within 0.1 after 18 steps; 30 leaves headroom.
+    results = [filter_obj(10.0) for _ in range(30)]
 
-    assert abs(result - 10.0) < 0.1
+    assert results == sorted(results)  # rises steadily toward it
+    assert abs(results[-1] - 10.0) < 0.1
 
 
 def test_one_euro_filter_alpha_calculation():
@@ -319,11 +344,21 @@ def test_one_euro_filter_custom_parameters():
     assert filter_obj.d_cutoff == 2.0
 
 
-@patch.object(eyetrack_plugin, "get_screen_size", return_value=(1920, 1080))
-@patch.object(eyetrack_plugin, "dbus_call", return_value=True)
-def test_listen_for_tracking_commands_stops_on_stop_command(
-    mock_dbus, mock_screen_size, mock_core
-):
+@pytest.fixture
+def desktop(stub_attrs):
+    """Stand-ins for the screen size query and the GNOME Shell D-Bus calls.
+
+    The screen is 1920x1080 and every call succeeds; tests read ``dbus_call``'s
+    calls to see which pointer action was sent.
+    """
+    return stub_attrs(
+        eyetrack_plugin,
+        get_screen_size=Mock(return_value=(1920, 1080)),
+        dbus_call=Mock(return_value=True),
+    )
+
+
+def test_listen_for_tracking_commands_stops_on_stop_command(desktop, mock_core):
     """When listen_for_tracking_commands receives stop then it exits loop."""
     eyetrack_plugin.tracking_active = True
     mock_core.wait_for_speech.return_value = b"audio"
@@ -336,77 +371,53 @@ def test_listen_for_tracking_commands_stops_on_stop_command(
     assert eyetrack_plugin.tracking_active is False
 
 
-@patch.object(eyetrack_plugin, "get_screen_size", return_value=(1920, 1080))
-@patch.object(eyetrack_plugin, "dbus_call", return_value=True)
-def test_listen_for_tracking_commands_freeze(mock_dbus, mock_screen_size, mock_core):
+def test_listen_for_tracking_commands_freeze(desktop, mock_core_factory):
     """When listen_for_tracking_commands receives freeze then it sets frozen flag."""
     eyetrack_plugin.tracking_active = True
     eyetrack_plugin.frozen = False
     eyetrack_plugin.cursor_x = 100
     eyetrack_plugin.cursor_y = 200
 
-    mock_core.wait_for_speech.side_effect = [b"audio1", b"audio2"]
-    mock_core.record_until_silence.return_value = b"more_audio"
-    mock_core.transcribe.side_effect = ["freeze", "stop"]
+    mock_core = mock_core_factory(transcribe_values=["freeze", "stop"])
 
     eyetrack_plugin.listen_for_tracking_commands(mock_core)
 
     assert eyetrack_plugin.frozen is False
 
 
-@patch.object(eyetrack_plugin, "get_screen_size", return_value=(1920, 1080))
-@patch.object(eyetrack_plugin, "dbus_call", return_value=True)
-def test_listen_for_tracking_commands_click(mock_dbus, mock_screen_size, mock_core):
+def test_listen_for_tracking_commands_click(desktop, mock_core_factory):
     """When listen_for_tracking_commands receives click then it calls dbus Click."""
     eyetrack_plugin.tracking_active = True
     eyetrack_plugin.cursor_x = 100
     eyetrack_plugin.cursor_y = 200
 
-    mock_core.wait_for_speech.side_effect = [b"audio1", b"audio2"]
-    mock_core.record_until_silence.return_value = b"more_audio"
-    mock_core.transcribe.side_effect = ["click", "stop"]
+    mock_core = mock_core_factory(transcribe_values=["click", "stop"])
 
     eyetrack_plugin.listen_for_tracking_commands(mock_core)
 
-    click_calls = [call for call in mock_dbus.call_args_list if call.args[0] == "Click"]
-    assert len(click_calls) >= 1
+    assert any(call.args[0] == "Click" for call in desktop.dbus_call.call_args_list)
 
 
-@patch.object(eyetrack_plugin, "get_screen_size", return_value=(1920, 1080))
-@patch.object(eyetrack_plugin, "dbus_call", return_value=True)
-def test_listen_for_tracking_commands_nudge_when_frozen(
-    mock_dbus, mock_screen_size, mock_core
-):
+def test_listen_for_tracking_commands_nudge_when_frozen(desktop, mock_core_factory):
     """When listen_for_tracking_commands receives nudge while frozen then it adjusts cursor."""
     eyetrack_plugin.tracking_active = True
     eyetrack_plugin.frozen = True
     eyetrack_plugin.cursor_x = 500
     eyetrack_plugin.cursor_y = 500
 
-    mock_core.wait_for_speech.side_effect = [b"audio1", b"audio2"]
-    mock_core.record_until_silence.return_value = b"more_audio"
-    mock_core.transcribe.side_effect = ["nudge right", "stop"]
+    mock_core = mock_core_factory(transcribe_values=["nudge right", "stop"])
 
     eyetrack_plugin.listen_for_tracking_commands(mock_core)
 
-    moveto_calls = [
-        call for call in mock_dbus.call_args_list if call.args[0] == "MoveTo"
-    ]
-    assert len(moveto_calls) >= 1
+    assert any(call.args[0] == "MoveTo" for call in desktop.dbus_call.call_args_list)
 
 
-@patch.object(eyetrack_plugin, "get_screen_size", return_value=(1920, 1080))
-@patch.object(eyetrack_plugin, "dbus_call", return_value=True)
-def test_listen_for_tracking_commands_go_unfreezes(
-    mock_dbus, mock_screen_size, mock_core
-):
+def test_listen_for_tracking_commands_go_unfreezes(desktop, mock_core_factory):
     """When listen_for_tracking_commands receives go then it unfreezes cursor."""
     eyetrack_plugin.tracking_active = True
     eyetrack_plugin.frozen = True
 
-    mock_core.wait_for_speech.side_effect = [b"audio1", b"audio2"]
-    mock_core.record_until_silence.return_value = b"more_audio"
-    mock_core.transcribe.side_effect = ["go", "stop"]
+    mock_core = mock_core_factory(transcribe_values=["go", "stop"])
 
     eyetrack_plugin.listen_for_tracking_commands(mock_core)
 
@@ -416,16 +427,14 @@ def test_listen_for_tracking_commands_go_unfreezes(
 @pytest.mark.parametrize(
     ["command", "expected_direction"],
     [
-        ["nudge up", "up"],
-        ["nudge down", "down"],
-        ["nudge left", "left"],
-        ["nudge right", "right"],
+        ("nudge up", "up"),
+        ("nudge down", "down"),
+        ("nudge left", "left"),
+        ("nudge right", "right"),
     ],
 )
-@patch.object(eyetrack_plugin, "get_screen_size", return_value=(1920, 1080))
-@patch.object(eyetrack_plugin, "dbus_call", return_value=True)
 def test_listen_for_tracking_commands_nudge_directions(
-    mock_dbus, mock_screen_size, command, expected_direction, mock_core
+    desktop, command, expected_direction, mock_core_factory
 ):
     """When listen_for_tracking_commands receives nudge commands then it moves cursor in specified direction."""
     eyetrack_plugin.tracking_active = True
@@ -433,30 +442,21 @@ def test_listen_for_tracking_commands_nudge_directions(
     eyetrack_plugin.cursor_x = 500
     eyetrack_plugin.cursor_y = 500
 
-    mock_core.wait_for_speech.side_effect = [b"audio1", b"audio2"]
-    mock_core.record_until_silence.return_value = b"more_audio"
-    mock_core.transcribe.side_effect = [command, "stop"]
+    mock_core = mock_core_factory(transcribe_values=[command, "stop"])
 
     eyetrack_plugin.listen_for_tracking_commands(mock_core)
 
-    moveto_calls = [
-        call for call in mock_dbus.call_args_list if call.args[0] == "MoveTo"
-    ]
-    assert len(moveto_calls) >= 1
+    assert any(call.args[0] == "MoveTo" for call in desktop.dbus_call.call_args_list)
 
 
-@patch.object(eyetrack_plugin, "get_screen_size", return_value=(1920, 1080))
-@patch.object(eyetrack_plugin, "dbus_call", return_value=True)
 @patch.object(eyetrack_plugin, "recalibrate", return_value=(True, "Recalibrating"))
 def test_listen_for_tracking_commands_recalibrate(
-    mock_recalibrate, mock_dbus, mock_screen_size, mock_core
+    mock_recalibrate, desktop, mock_core_factory
 ):
     """When listen_for_tracking_commands receives recalibrate then it recalibrates."""
     eyetrack_plugin.tracking_active = True
 
-    mock_core.wait_for_speech.side_effect = [b"audio1", b"audio2"]
-    mock_core.record_until_silence.return_value = b"more_audio"
-    mock_core.transcribe.side_effect = ["recalibrate", "stop"]
+    mock_core = mock_core_factory(transcribe_values=["recalibrate", "stop"])
 
     eyetrack_plugin.listen_for_tracking_commands(mock_core)
 
@@ -464,69 +464,51 @@ def test_listen_for_tracking_commands_recalibrate(
     assert mock_core.speak.call_args_list[0].args[0] == "Recalibrating"
 
 
-@patch.object(eyetrack_plugin, "get_screen_size", return_value=(1920, 1080))
-@patch.object(eyetrack_plugin, "dbus_call", return_value=True)
-def test_listen_for_tracking_commands_double_click(
-    mock_dbus, mock_screen_size, mock_core
-):
+def test_listen_for_tracking_commands_double_click(desktop, mock_core_factory):
     """When listen_for_tracking_commands receives double click then it calls dbus DoubleClick."""
     eyetrack_plugin.tracking_active = True
     eyetrack_plugin.cursor_x = 100
     eyetrack_plugin.cursor_y = 200
 
-    mock_core.wait_for_speech.side_effect = [b"audio1", b"audio2"]
-    mock_core.record_until_silence.return_value = b"more_audio"
-    mock_core.transcribe.side_effect = ["double click", "stop"]
+    mock_core = mock_core_factory(transcribe_values=["double click", "stop"])
 
     eyetrack_plugin.listen_for_tracking_commands(mock_core)
 
-    double_click_calls = [
-        call for call in mock_dbus.call_args_list if call.args[0] == "DoubleClick"
-    ]
-    assert len(double_click_calls) >= 1
+    assert any(
+        call.args[0] == "DoubleClick" for call in desktop.dbus_call.call_args_list
+    )
 
 
-@patch.object(eyetrack_plugin, "get_screen_size", return_value=(1920, 1080))
-@patch.object(eyetrack_plugin, "dbus_call", return_value=True)
-def test_listen_for_tracking_commands_right_click(
-    mock_dbus, mock_screen_size, mock_core
-):
+def test_listen_for_tracking_commands_right_click(desktop, mock_core_factory):
     """When listen_for_tracking_commands receives right click then it calls dbus RightClick."""
     eyetrack_plugin.tracking_active = True
     eyetrack_plugin.cursor_x = 100
     eyetrack_plugin.cursor_y = 200
 
-    mock_core.wait_for_speech.side_effect = [b"audio1", b"audio2"]
-    mock_core.record_until_silence.return_value = b"more_audio"
-    mock_core.transcribe.side_effect = ["right click", "stop"]
+    mock_core = mock_core_factory(transcribe_values=["right click", "stop"])
 
     eyetrack_plugin.listen_for_tracking_commands(mock_core)
 
-    right_click_calls = [
-        call for call in mock_dbus.call_args_list if call.args[0] == "RightClick"
-    ]
-    assert len(right_click_calls) >= 1
+    assert any(
+        call.args[0] == "RightClick" for call in desktop.dbus_call.call_args_list
+    )
 
 
 @pytest.mark.parametrize(
-    ["exit_command"],
+    "exit_command",
     [
-        ["stop tracking"],
-        ["end tracking"],
-        ["close tracking"],
-        ["stop"],
-        ["cancel"],
-        ["escape"],
-        ["exit"],
-        ["quit"],
-        ["done"],
+        "stop tracking",
+        "end tracking",
+        "close tracking",
+        "stop",
+        "cancel",
+        "escape",
+        "exit",
+        "quit",
+        "done",
     ],
 )
-@patch.object(eyetrack_plugin, "get_screen_size", return_value=(1920, 1080))
-@patch.object(eyetrack_plugin, "dbus_call", return_value=True)
-def test_listen_for_tracking_commands_exit_commands(
-    mock_dbus, mock_screen_size, exit_command, mock_core
-):
+def test_listen_for_tracking_commands_exit_commands(desktop, exit_command, mock_core):
     """When listen_for_tracking_commands receives exit commands then it stops tracking."""
     eyetrack_plugin.tracking_active = True
 
@@ -560,29 +542,24 @@ def test_listen_for_tracking_commands_exit_commands(
         (True, 50, [[[1.0], [2.0], [0.0]]] * 10 + [[[-10.0], [-12.0], [0.0]]] * 40),
     ],
 )
-@patch.object(eyetrack_plugin, "get_screen_size", return_value=(1920, 1080))
-@patch.object(eyetrack_plugin, "dbus_call", return_value=True)
 def test_run_tracking_scenarios(
-    mock_dbus,
-    mock_screen_size,
-    webcam_opens,
-    frame_count,
-    prediction_sequence,
+    desktop, webcam_opens, frame_count, prediction_sequence
 ):
     """When run_tracking is called with various scenarios then it handles them appropriately."""
     mock_cap = Mock()
     mock_cap.isOpened.return_value = webcam_opens
 
-    # Set up frame reading to return frames for frame_count iterations
+    # Set up frame reading to return frames for frame_count iterations. The
+    # frame only passes through the mocked cv2 and model, so one will do.
+    frame = object()
     read_counter = [0]
 
     def read_side_effect():
         read_counter[0] += 1
-        if read_counter[0] > frame_count + 20:
-            # Safety: force stop after many iterations to prevent infinite loop
-            eyetrack_plugin.stop_event.set()
         if read_counter[0] <= frame_count:
-            return (True, Mock())
+            return (True, frame)
+        # Out of frames: fail this read and end the loop after it.
+        eyetrack_plugin.stop_event.set()
         return (False, None)
 
     mock_cap.read.side_effect = read_side_effect
@@ -590,18 +567,15 @@ def test_run_tracking_scenarios(
 
     mock_model = Mock()
     if prediction_sequence:
-        # Return different predictions per frame
+        # Return different predictions per frame, repeating the last one for
+        # any extra frames
+        predictions = [tuple(pred) for pred in prediction_sequence]
         predict_counter = [0]
 
         def predict_side_effect(frame):
-            idx = predict_counter[0]
+            idx = min(predict_counter[0], len(predictions) - 1)
             predict_counter[0] += 1
-            if idx < len(prediction_sequence):
-                pred = prediction_sequence[idx]
-                return (pred[0], pred[1], pred[2])
-            # Return last prediction for any extra frames
-            pred = prediction_sequence[-1]
-            return (pred[0], pred[1], pred[2])
+            return predictions[idx]
 
         mock_model.predict.side_effect = predict_side_effect
     else:
@@ -611,7 +585,7 @@ def test_run_tracking_scenarios(
 
     mock_cv2 = Mock()
     mock_cv2.VideoCapture.return_value = mock_cap
-    mock_cv2.flip.return_value = Mock()
+    mock_cv2.flip.return_value = frame
 
     with patch.dict(
         "sys.modules",
@@ -624,11 +598,9 @@ def test_run_tracking_scenarios(
         eyetrack_plugin.stop_event.clear()
 
         # read_side_effect already stops the loop deterministically once the
-        # frames run out. Stub the real-time pacing sleep so the loop processes
-        # every frame at full speed, making coverage of the motion branches
-        # stable instead of racing a wall-clock timer.
-        with patch("time.sleep"):
-            eyetrack_plugin.run_tracking()
+        # frames run out, and skip_sleeps lets it process every frame at full
+        # speed, so coverage of the motion branches doesn't race a timer.
+        eyetrack_plugin.run_tracking()
 
         # After run_tracking completes, tracking_active should be False
         assert eyetrack_plugin.tracking_active is False
@@ -636,8 +608,7 @@ def test_run_tracking_scenarios(
             assert mock_cap.release.called
 
 
-@patch.object(eyetrack_plugin, "get_screen_size", return_value=(1920, 1080))
-def test_listen_for_tracking_commands_thread_gone(mock_screen_size, mock_core):
+def test_listen_for_tracking_commands_thread_gone(desktop, mock_core):
     """When tracking has stopped then the mode ends on the next command."""
     eyetrack_plugin.tracking_active = False
     mock_core.transcribe.return_value = "click"
@@ -651,11 +622,7 @@ def test_listen_for_tracking_commands_thread_gone(mock_screen_size, mock_core):
     ["command", "expected"],
     [("freeze", "Frozen"), ("go", "Following")],
 )
-@patch.object(eyetrack_plugin, "get_screen_size", return_value=(1920, 1080))
-@patch.object(eyetrack_plugin, "dbus_call", return_value=True)
-def test_tracking_announces_its_state(
-    mock_dbus, mock_screen, command, expected, mock_core_factory
-):
+def test_tracking_announces_its_state(desktop, command, expected, mock_core_factory):
     """Whether the cursor is following the head is otherwise a guess."""
     mock_core = mock_core_factory(transcribe_values=[command, "stop tracking"])
     eyetrack_plugin.tracking_active = True
@@ -665,11 +632,7 @@ def test_tracking_announces_its_state(
     assert expected in [call.args[0] for call in mock_core.speak.call_args_list]
 
 
-@patch.object(eyetrack_plugin, "get_screen_size", return_value=(1920, 1080))
-@patch.object(eyetrack_plugin, "dbus_call", return_value=True)
-def test_tracking_replies_cannot_re_trigger_themselves(
-    mock_dbus, mock_screen, mock_core_factory
-):
+def test_tracking_replies_cannot_re_trigger_themselves(desktop, mock_core_factory):
     """Tracking keeps listening, so a reply that repeats its own trigger loops.
 
     "Frozen" and "Following" are chosen to contain none of the words that reach
@@ -1,6 +1,6 @@
 """Tests for the files plugin module."""
 
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 from easyspeak.plugins import files
@@ -22,28 +22,37 @@ def test_open_folder_expands_path(mock_path, mock_core):
     mock_path.return_value.expanduser.assert_called_once_with()
 
 
+@patch.object(files.shutil, "which", return_value="/usr/bin/xdg-open")
 @patch("easyspeak.plugins.files.Path")
-def test_open_folder_uses_xdg_open(mock_path, mock_core_which_finds_file_manager):
+def test_open_folder_uses_xdg_open(mock_path, mock_which, mock_core):
     """When xdg-open is available then open_folder launches it with a clean env."""
     mock_path.return_value.expanduser.return_value = "/home/user/Documents"
-    core = mock_core_which_finds_file_manager("xdg-open")
 
-    result = files.open_folder("~/Documents", core)
+    result = files.open_folder("~/Documents", mock_core)
 
     assert result is True
-    launch = core.host_run.call_args_list[-1]
+    mock_which.assert_called_once_with("xdg-open")
+    launch = mock_core.host_run.call_args
     assert launch.args[0] == ["xdg-open", "/home/user/Documents"]
     assert launch.kwargs["background"] is True
     assert launch.kwargs["clean_env"] is True
 
 
-def test_open_folder_returns_false_when_no_file_manager_found(
-    mock_core_no_file_manager,
-):
+@patch.object(files.shutil, "which", return_value=None)
+def test_open_folder_returns_false_when_no_file_manager_found(mock_which, mock_core):
     """When no file manager is available then open_folder returns False."""
-    result = files.open_folder("~/Documents", mock_core_no_file_manager)
+    result = files.open_folder("~/Documents", mock_core)
 
     assert result is False
+    assert not mock_core.host_run.called
+
+
+@pytest.fixture
+def opener(monkeypatch):
+    """Stand-in for open_folder that reports the file manager was launched."""
+    stub = Mock(return_value=True)
+    monkeypatch.setattr(files, "open_folder", stub)
+    return stub
 
 
 @pytest.mark.parametrize(
@@ -59,16 +68,15 @@ def test_open_folder_returns_false_when_no_file_manager_found(
         ("open desktop", "desktop", "Opening desktop."),
     ],
 )
-@patch("easyspeak.plugins.files.open_folder", return_value=True)
 def test_handle_open_command_with_folders(
-    mock_open_folder, command, folder_name, expected_message, mock_core
+    command, folder_name, expected_message, mock_core, opener
 ):
     """When handle receives a folder command then it opens the folder and speaks."""
     result = files.handle(command, mock_core)
 
     assert result is True
-    assert mock_open_folder.call_count == 1
-    assert mock_open_folder.call_args.args == (files.FOLDERS[folder_name], mock_core)
+    assert opener.call_count == 1
+    assert opener.call_args.args == (files.FOLDERS[folder_name], mock_core)
     assert mock_core.speak.call_count == 1
     assert mock_core.speak.call_args.args == (expected_message,)
 
@@ -81,28 +89,26 @@ def test_handle_open_command_with_folders(
         "show file browser",
     ],
 )
-@patch("easyspeak.plugins.files.open_folder", return_value=True)
-def test_handle_opens_default_file_manager(mock_open_folder, command, mock_core):
+def test_handle_opens_default_file_manager(command, mock_core, opener):
     """When asked for the file manager then handle opens it at home and speaks."""
     result = files.handle(command, mock_core)
 
     assert result is True
-    assert mock_open_folder.call_args.args == ("~", mock_core)
+    assert opener.call_args.args == ("~", mock_core)
     assert mock_core.speak.call_args.args == ("Opening files.",)
 
 
 @pytest.mark.parametrize(
-    ["command_prefix"],
+    "command_prefix",
     [
-        ("open",),
-        ("go to",),
-        ("show",),
-        ("browse",),
+        "open",
+        "go to",
+        "show",
+        "browse",
     ],
 )
-@patch("easyspeak.plugins.files.open_folder", return_value=True)
 def test_handle_recognizes_different_command_prefixes(
-    mock_open_folder, command_prefix, mock_core
+    command_prefix, mock_core, opener
 ):
     """When handle receives commands with different prefixes then it recognizes them."""
     command = f"{command_prefix} documents"
@@ -110,12 +116,13 @@ def test_handle_recognizes_different_command_prefixes(
     result = files.handle(command, mock_core)
 
     assert result is True
-    assert mock_open_folder.call_count == 1
+    assert opener.call_count == 1
 
 
-@patch("easyspeak.plugins.files.open_folder", return_value=False)
-def test_handle_speaks_error_when_no_file_manager_found(mock_open_folder, mock_core):
+def test_handle_speaks_error_when_no_file_manager_found(mock_core, opener):
     """When no file manager is found then handle speaks an error message."""
+    opener.return_value = False
+
     result = files.handle("open documents", mock_core)
 
     assert result is True
@@ -124,32 +131,42 @@ def test_handle_speaks_error_when_no_file_manager_found(mock_open_folder, mock_c
 
 
 @pytest.mark.parametrize(
-    ["command"],
+    "command",
     [
-        ("hello world",),
-        ("what time is it",),
-        ("play music",),
-        ("close window",),
-        ("unrelated command",),
+        "hello world",
+        "what time is it",
+        "play music",
+        "close window",
+        "unrelated command",
     ],
 )
-@patch("easyspeak.plugins.files.open_folder")
-def test_handle_returns_none_for_unrelated_commands(
-    mock_open_folder, command, mock_core
-):
+def test_handle_returns_none_for_unrelated_commands(command, mock_core, opener):
     """When handle receives unrelated commands then it returns None."""
     result = files.handle(command, mock_core)
 
     assert result is None
-    assert not mock_open_folder.called
+    assert not opener.called
 
 
-@patch("easyspeak.plugins.files.open_folder")
-def test_handle_requires_both_folder_and_action_keywords(mock_open_folder, mock_core):
+def test_handle_requires_both_folder_and_action_keywords(mock_core, opener):
     """When handle receives incomplete commands then it returns None."""
     result1 = files.handle("documents", mock_core)
     result2 = files.handle("open something else", mock_core)
 
     assert result1 is None
     assert result2 is None
-    assert not mock_open_folder.called
+    assert not opener.called
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        "show me my homework",
+        "reopen my downloads",
+        "open the filesystem settings",
+    ],
+)
+def test_handle_matches_whole_words_only(command, mock_core, opener):
+    """When a folder or verb only appears inside a longer word then it is ignored."""
+    assert files.handle(command, mock_core) is None
+    assert not opener.called
@@ -1,9 +1,12 @@
 """Tests for the media plugin module."""
 
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
+from easyspeak.core import session_bus
 from easyspeak.plugins import media
+from jeepney import AuthenticationError, HeaderFields
 
 
 def test_setup(mock_core):
@@ -13,44 +16,62 @@ def test_setup(mock_core):
     assert media.core is mock_core
 
 
+@pytest.fixture
+def bus(monkeypatch):
+    """Stand-in session-bus connection; Spotify and VLC are running by default.
+
+    The shared connection is kept between commands, so it is cleared here too,
+    or the first test's stand-in would be reused by the rest.
+    """
+    conn = Mock()
+    conn.send_and_get_reply.return_value = SimpleNamespace(
+        body=(
+            [
+                "org.freedesktop.DBus",
+                "org.mpris.MediaPlayer2.spotify",
+                "org.mpris.MediaPlayer2.vlc",
+            ],
+        )
+    )
+    monkeypatch.setattr(session_bus, "_bus", None)
+    monkeypatch.setattr(session_bus, "open_dbus_connection", Mock(return_value=conn))
+    return conn
+
+
+def sent(conn):
+    """(destination, member) of each message sent without waiting for a reply."""
+    return [
+        (
+            call.args[0].header.fields[HeaderFields.destination],
+            call.args[0].header.fields[HeaderFields.member],
+        )
+        for call in conn.send.call_args_list
+    ]
+
+
 @pytest.mark.parametrize(
-    ["stdout_content", "expected_players"],
+    ["names", "expected_players"],
     [
         (
-            'string "org.mpris.MediaPlayer2.spotify"\n',
+            ["org.mpris.MediaPlayer2.spotify"],
             ["org.mpris.MediaPlayer2.spotify"],
         ),
         (
-            'string "org.mpris.MediaPlayer2.vlc"\nstring "org.mpris.MediaPlayer2.spotify"\n',
-            ["org.mpris.MediaPlayer2.vlc", "org.mpris.MediaPlayer2.spotify"],
-        ),
-        (
-            'string "org.freedesktop.DBus"\nstring "org.mpris.MediaPlayer2.rhythmbox"\n',
+            ["org.freedesktop.DBus", ":1.42", "org.mpris.MediaPlayer2.rhythmbox"],
             ["org.mpris.MediaPlayer2.rhythmbox"],
         ),
-        (
-            'string "org.freedesktop.DBus"\nstring "some.other.service"\n',
-            [],
-        ),
-        ("", []),
+        (["org.freedesktop.DBus", "some.other.service"], []),
+        ([], []),
     ],
 )
-def test_get_media_players(stdout_content, expected_players, mock_core):
-    """When get_media_players is called then it parses MPRIS players from dbus output."""
-    mock_core.host_run.return_value = Mock(stdout=stdout_content)
-
-    result = media.get_media_players(mock_core)
-
-    assert result == expected_players
-    assert mock_core.host_run.call_args.args[0] == [
-        "dbus-send",
-        "--session",
-        "--dest=org.freedesktop.DBus",
-        "--type=method_call",
-        "--print-reply",
-        "/org/freedesktop/DBus",
-        "org.freedesktop.DBus.ListNames",
-    ]
+def test_get_media_players(names, expected_players, bus):
+    """When get_media_players is called then it keeps only the MPRIS bus names."""
+    bus.send_and_get_reply.return_value = SimpleNamespace(body=(names,))
+
+    assert media.get_media_players() == expected_players
+    message = bus.send_and_get_reply.call_args.args[0]
+    assert message.header.fields[HeaderFields.member] == "ListNames"
+    assert bus.send_and_get_reply.call_args.kwargs == {"timeout": session_bus.TIMEOUT}
 
 
 @pytest.mark.parametrize(
@@ -62,71 +83,94 @@ def test_get_media_players(stdout_content, expected_players, mock_core):
         ("previous", "Previous"),
     ],
 )
-@patch.object(
-    media,
-    "get_media_players",
-    return_value=["org.mpris.MediaPlayer2.spotify", "org.mpris.MediaPlayer2.vlc"],
-)
-def test_media_control_with_players(
-    mock_get_players, action, expected_method, mock_core
-):
+def test_media_control_with_players(action, expected_method, bus):
     """When media_control is called with a valid action then it sends the command to all players."""
-    result = media.media_control(action, mock_core)
+    result = media.media_control(action)
 
     assert result is True
-    assert mock_core.host_run.call_count == 2
-    for call in mock_core.host_run.call_args_list:
-        cmd_args = call.args[0]
-        assert cmd_args[0] == "dbus-send"
-        assert cmd_args[1] == "--session"
-        assert cmd_args[2] == "--type=method_call"
-        assert cmd_args[4] == "/org/mpris/MediaPlayer2"
-        assert cmd_args[5] == f"org.mpris.MediaPlayer2.Player.{expected_method}"
-
-
-@patch.object(media, "get_media_players", return_value=[])
-def test_media_control_with_no_players(mock_get_players, mock_core):
+    assert sent(bus) == [
+        ("org.mpris.MediaPlayer2.spotify", expected_method),
+        ("org.mpris.MediaPlayer2.vlc", expected_method),
+    ]
+
+
+def test_media_control_reuses_one_connection(bus):
+    """When several commands are given then they share one session-bus connection."""
+    media.media_control("play")
+    media.media_control("pause")
+
+    assert session_bus.open_dbus_connection.call_count == 1
+    assert bus.send.call_count == 4
+
+
+def test_media_control_with_no_players(bus):
     """When media_control is called with no players available then it returns False."""
-    result = media.media_control("play", mock_core)
+    bus.send_and_get_reply.return_value = SimpleNamespace(body=([],))
+
+    result = media.media_control("play")
 
     assert result is False
-    assert not mock_core.host_run.called
+    assert not bus.send.called
 
 
-@patch.object(
-    media, "get_media_players", return_value=["org.mpris.MediaPlayer2.spotify"]
-)
-def test_media_control_with_invalid_action(mock_get_players, mock_core):
+def test_media_control_with_invalid_action(bus):
     """When media_control is called with an invalid action then it returns False."""
-    result = media.media_control("invalid", mock_core)
+    result = media.media_control("invalid")
 
     assert result is False
-    assert not mock_core.host_run.called
+    assert not bus.send_and_get_reply.called
 
 
 @pytest.mark.parametrize(
-    ["command", "expected_action", "expected_speech"],
+    "error",
     [
-        ("play", "play", "Playing."),
-        ("play music", "play", "Playing."),
-        ("resume", "play", "Playing."),
+        KeyError("DBUS_SESSION_BUS_ADDRESS"),
+        OSError,
+        AuthenticationError(b"REJECTED EXTERNAL"),
+        TimeoutError,
     ],
 )
-@patch.object(media, "media_control", return_value=True)
-def test_handle_play_commands(
-    mock_media_control, command, expected_action, expected_speech, mock_core
-):
-    """When handle receives a play command then it calls media_control and speaks."""
-    result = media.handle(command, mock_core)
+def test_media_control_without_a_session_bus(error, bus):
+    """When the session bus can't be reached then media_control returns False."""
+    session_bus.open_dbus_connection.side_effect = error
 
-    assert result is True
-    assert mock_media_control.call_args.args == (expected_action, mock_core)
-    assert mock_core.speak.call_args.args[0] == expected_speech
+    assert media.media_control("play") is False
+
+
+def test_media_control_when_the_bus_daemon_times_out(bus):
+    """When ListNames gets no answer in time then media_control returns False."""
+    bus.send_and_get_reply.side_effect = TimeoutError
+
+    assert media.media_control("play") is False
+    assert bus.close.called
+    assert not bus.send.called
+
+
+def test_media_control_reconnects_after_a_failure(bus):
+    """When the connection breaks then it is dropped and the next command reopens it."""
+    bus.send.side_effect = [BrokenPipeError, None, None]
+
+    assert media.media_control("play") is False
+    assert bus.close.called
+    assert media.media_control("play") is True
+    assert session_bus.open_dbus_connection.call_count == 2
+
+
+@pytest.fixture
+def control(monkeypatch):
+    """Stand-in for media_control that reports the action reached a player."""
+    stub = Mock(return_value=True)
+    monkeypatch.setattr(media, "media_control", stub)
+    return stub
 
 
 @pytest.mark.parametrize(
     ["command", "expected_action", "expected_speech"],
     [
+        ("play", "play", "Playing."),
+        ("play music", "play", "Playing."),
+        ("resume", "play", "Playing."),
+        # "stop the music" pauses rather than stopping the player outright
         ("pause", "pause", "Paused."),
         ("pause music", "pause", "Paused."),
         ("pause the music", "pause", "Paused."),
@@ -136,82 +180,44 @@ def test_handle_play_commands(
         ("stop the song", "pause", "Paused."),
         ("stop playing music", "pause", "Paused."),
         ("stop playing", "pause", "Paused."),
-    ],
-)
-@patch.object(media, "media_control", return_value=True)
-def test_handle_pause_commands(
-    mock_media_control, command, expected_action, expected_speech, mock_core
-):
-    """Pause and "stop the music" both pause playback and speak."""
-    result = media.handle(command, mock_core)
-
-    assert result is True
-    assert mock_media_control.call_args.args == (expected_action, mock_core)
-    assert mock_core.speak.call_args.args[0] == expected_speech
-
-
-@pytest.mark.parametrize("command", ["stop", "stop tracking", "stop it"])
-@patch.object(media, "media_control", return_value=True)
-def test_handle_ignores_bare_stop(mock_media_control, command, mock_core):
-    """A bare "stop" is not a media command."""
-    assert media.handle(command, mock_core) is None
-    assert not mock_media_control.called
-
-
-@pytest.mark.parametrize(
-    ["command", "expected_action", "expected_speech"],
-    [
         ("next", "next", "Next."),
         ("next track", "next", "Next."),
         ("skip", "next", "Next."),
         ("skip song", "next", "Next."),
-    ],
-)
-@patch.object(media, "media_control", return_value=True)
-def test_handle_next_commands(
-    mock_media_control, command, expected_action, expected_speech, mock_core
-):
-    """When handle receives a next command then it calls media_control and speaks."""
-    result = media.handle(command, mock_core)
-
-    assert result is True
-    assert mock_media_control.call_args.args == (expected_action, mock_core)
-    assert mock_core.speak.call_args.args[0] == expected_speech
-
-
-@pytest.mark.parametrize(
-    ["command", "expected_action", "expected_speech"],
-    [
         ("previous", "previous", "Previous."),
         ("previous track", "previous", "Previous."),
     ],
 )
-@patch.object(media, "media_control", return_value=True)
-def test_handle_previous_commands(
-    mock_media_control, command, expected_action, expected_speech, mock_core
+def test_handle_playback_commands(
+    command, expected_action, expected_speech, mock_core, control
 ):
-    """When handle receives a previous command then it calls media_control and speaks."""
+    """When handle receives a playback command then it calls media_control and speaks."""
     result = media.handle(command, mock_core)
 
     assert result is True
-    assert mock_media_control.call_args.args == (expected_action, mock_core)
+    assert control.call_args.args == (expected_action,)
     assert mock_core.speak.call_args.args[0] == expected_speech
 
 
-@patch.object(media, "media_control", return_value=True)
-def test_handle_two_verbs_is_not_a_command(mock_media_control, mock_core):
+@pytest.mark.parametrize("command", ["stop", "stop tracking", "stop it"])
+def test_handle_ignores_bare_stop(command, mock_core, control):
+    """A bare "stop" is not a media command."""
+    assert media.handle(command, mock_core) is None
+    assert not control.called
+
+
+def test_handle_two_verbs_is_not_a_command(mock_core, control):
     """When an utterance names two verbs then it is too ambiguous to act on."""
     assert media.handle("play pause", mock_core) is None
-    assert not mock_media_control.called
+    assert not control.called
 
 
-@patch.object(media, "media_control")
-def test_handle_unrecognized_command(mock_media_control, mock_core):
+def test_handle_unrecognized_command(mock_core, control):
     """When handle receives an unrecognized command then it returns None."""
     result = media.handle("unrelated command", mock_core)
 
     assert result is None
-    assert not mock_media_control.called
+    assert not control.called
     assert not mock_core.speak.called
 
 
@@ -235,11 +241,10 @@ def test_handle_unrecognized_command(mock_media_control, mock_core):
         "stop listening",
     ],
 )
-@patch.object(media, "media_control")
-def test_handle_leaves_non_media_commands_alone(mock_media_control, command, mock_core):
+def test_handle_leaves_non_media_commands_alone(command, mock_core, control):
     """When a command merely contains a playback verb then it is passed on."""
     assert media.handle(command, mock_core) is None
-    assert not mock_media_control.called
+    assert not control.called
 
 
 @pytest.mark.parametrize(
@@ -252,28 +257,27 @@ def test_handle_leaves_non_media_commands_alone(mock_media_control, command, moc
         ("play music", "play"),
     ],
 )
-@patch.object(media, "media_control", return_value=True)
 def test_handle_accepts_a_verb_with_a_media_noun(
-    mock_media_control, command, expected_action, mock_core
+    command, expected_action, mock_core, control
 ):
     """When the command names what is playing then the verb still resolves."""
     assert media.handle(command, mock_core) is True
-    assert mock_media_control.call_args.args[0] == expected_action
+    assert control.call_args.args[0] == expected_action
 
 
-@patch.object(media, "media_control", return_value=False)
-def test_handle_reports_when_no_player_is_running(mock_media_control, mock_core):
+def test_handle_reports_when_no_player_is_running(mock_core, control):
     """When nothing is playing then say so rather than claiming success.
 
     The reply used to be spoken before the action, so "play" with no player
     running answered "Playing." and did nothing at all.
     """
+    control.return_value = False
+
     assert media.handle("play", mock_core) is True
     assert mock_core.speak.call_args.args[0] == "No media player is running."
 
 
-@patch.object(media, "media_control", return_value=True)
-def test_handle_speaks_only_after_the_action(mock_media_control, mock_core):
+def test_handle_speaks_only_after_the_action(mock_core, control):
     """When playback is controlled then the confirmation follows the action."""
     assert media.handle("pause", mock_core) is True
     assert mock_core.speak.call_args.args[0] == "Paused."
@@ -1,9 +1,12 @@
 """Tests for the mousegrid plugin module."""
 
 import importlib
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
+from easyspeak.core import session_bus
+from jeepney import AuthenticationError, HeaderFields, MessageType
 
 mousegrid_plugin = importlib.import_module("easyspeak.plugins.00_mousegrid")
 
@@ -17,6 +20,7 @@ def reset_mousegrid_state():
     mousegrid_plugin.screen_size = None
     mousegrid_plugin.last_bounds = None
     mousegrid_plugin.drag_start = None
+    mousegrid_plugin._screen_size_cache = None
 
     yield
 
@@ -26,6 +30,7 @@ def reset_mousegrid_state():
     mousegrid_plugin.screen_size = None
     mousegrid_plugin.last_bounds = None
     mousegrid_plugin.drag_start = None
+    mousegrid_plugin._screen_size_cache = None
 
 
 def test_setup(mock_core):
@@ -37,27 +42,6 @@ def test_setup(mock_core):
     assert mousegrid_plugin.core is mock_core
 
 
-@patch("subprocess.run", return_value=Mock(returncode=0, stdout="", stderr=""))
-def test_host_run(mock_subprocess_run):
-    """When host_run is called then it executes subprocess with capture_output and text."""
-    cmd = ["test", "command"]
-
-    result = mousegrid_plugin.host_run(cmd)
-
-    assert mock_subprocess_run.call_args.args[0] == cmd
-    assert mock_subprocess_run.call_args.kwargs["capture_output"] is True
-    assert mock_subprocess_run.call_args.kwargs["text"] is True
-    assert result.returncode == 0
-
-
-@patch("subprocess.run", side_effect=FileNotFoundError(2, "No such file or directory"))
-def test_host_run_missing_executable(_mock_subprocess_run):
-    """A missing executable (e.g. gdbus on headless WSL) returns a failed result."""
-    result = mousegrid_plugin.host_run(["gdbus", "call"])
-
-    assert result.returncode == 1
-
-
 @patch.object(mousegrid_plugin, "dbus_call", return_value=True)
 def test_cleanup(mock_dbus_call):
     """When cleanup is called then it hides the grid via dbus."""
@@ -66,90 +50,184 @@ def test_cleanup(mock_dbus_call):
     assert mock_dbus_call.call_args.args == ("Hide",)
 
 
+@pytest.fixture
+def bus(monkeypatch):
+    """Stand-in session-bus connection whose calls all succeed with an empty reply.
+
+    The shared connection is kept between calls, so it is cleared here too, or
+    the first test's stand-in would be reused by the rest.
+    """
+    conn = Mock()
+    conn.send_and_get_reply.return_value = reply()
+    monkeypatch.setattr(session_bus, "_bus", None)
+    monkeypatch.setattr(session_bus, "open_dbus_connection", Mock(return_value=conn))
+    return conn
+
+
+def reply(*body, message_type=MessageType.method_return):
+    """A D-Bus reply as the plugin reads it: a message type and a body."""
+    return SimpleNamespace(header=SimpleNamespace(message_type=message_type), body=body)
+
+
 @pytest.mark.parametrize(
-    ["method", "args", "expected_returncode", "expected_result"],
+    ["method", "args", "signature"],
     [
-        ("Show", [1920, 1080], 0, True),
-        ("Hide", [], 0, True),
-        ("Update", [100, 200, 300, 400], 0, True),
-        ("Click", [500, 600], 0, True),
-        ("Show", [1920, 1080], 1, False),
+        ("Show", (1920, 1080), "ii"),
+        ("Hide", (), ""),
+        ("Update", (100, 200, 300, 400), "iiii"),
+        ("Click", (500, 600), "ii"),
+        ("Scroll", (500, 600, "down", 3), "iisi"),
     ],
 )
-@patch.object(mousegrid_plugin, "host_run")
-def test_dbus_call(mock_host_run, method, args, expected_returncode, expected_result):
-    """When dbus_call is invoked then it constructs gdbus command and returns success status."""
-    mock_host_run.return_value = Mock(returncode=expected_returncode)
-
+def test_dbus_call(method, args, signature, bus):
+    """When dbus_call is invoked then it calls the extension method with typed args."""
     result = mousegrid_plugin.dbus_call(method, *args)
 
-    assert result == expected_result
-    call_args = mock_host_run.call_args.args[0]
-    assert call_args[0] == "gdbus"
-    assert call_args[1] == "call"
-    assert call_args[2] == "--session"
-    assert call_args[3] == "--dest"
-    assert call_args[4] == "org.gnome.Shell"
-    assert call_args[5] == "--object-path"
-    assert call_args[6] == "/org/easyspeak/Desktop"
-    assert call_args[7] == "--method"
-    assert call_args[8] == f"org.easyspeak.Desktop.{method}"
-    assert call_args[9:] == [str(a) for a in args]
+    assert result is True
+    message = bus.send_and_get_reply.call_args.args[0]
+    fields = message.header.fields
+    assert fields[HeaderFields.destination] == "org.gnome.Shell"
+    assert fields[HeaderFields.path] == "/org/easyspeak/Desktop"
+    assert fields[HeaderFields.interface] == "org.easyspeak.Desktop"
+    assert fields[HeaderFields.member] == method
+    assert fields.get(HeaderFields.signature, "") == signature
+    assert message.body == args
+    assert bus.send_and_get_reply.call_args.kwargs == {"timeout": session_bus.TIMEOUT}
+
+
+def test_dbus_call_reuses_one_connection(bus):
+    """When the grid makes several calls then they share one session-bus connection."""
+    mousegrid_plugin.dbus_call("Show", 1920, 1080)
+    mousegrid_plugin.dbus_call("Hide")
+
+    assert session_bus.open_dbus_connection.call_count == 1
+    assert bus.send_and_get_reply.call_count == 2
+
+
+def test_dbus_call_error_reply(bus):
+    """When the extension isn't loaded then the error reply is a plain failure."""
+    bus.send_and_get_reply.return_value = reply(
+        "No such interface", message_type=MessageType.error
+    )
+
+    assert mousegrid_plugin.dbus_call("Show", 1920, 1080) is False
+    assert not bus.close.called
 
 
 @pytest.mark.parametrize(
-    ["stdout", "expected_size"],
+    "error",
     [
-        ("((1920, 1080),)\n", (1920, 1080)),
-        ("((2560, 1440),)\n", (2560, 1440)),
-        ("((3840, 2160),)\n", (3840, 2160)),
-        ("invalid output", (1920, 1080)),
-        ("", (1920, 1080)),
+        KeyError("DBUS_SESSION_BUS_ADDRESS"),
+        ConnectionRefusedError,
+        AuthenticationError(b"REJECTED EXTERNAL"),
+        TimeoutError,
     ],
 )
-@patch.object(mousegrid_plugin, "host_run")
-def test_get_screen_size(mock_host_run, stdout, expected_size):
-    """When get_screen_size is called then it parses screen dimensions from gdbus output."""
-    mock_host_run.return_value = Mock(returncode=0, stdout=stdout)
+def test_dbus_call_without_a_session_bus(error, bus):
+    """When there is no session bus (e.g. headless WSL) then dbus_call returns False."""
+    session_bus.open_dbus_connection.side_effect = error
 
-    result = mousegrid_plugin.get_screen_size()
+    assert mousegrid_plugin.dbus_call("Hide") is False
+
+
+def test_dbus_call_reconnects_after_a_failure(bus):
+    """When the connection breaks then it is dropped and the next call reopens it."""
+    bus.send_and_get_reply.side_effect = [TimeoutError, reply()]
+
+    assert mousegrid_plugin.dbus_call("Hide") is False
+    assert bus.close.called
+    assert mousegrid_plugin.dbus_call("Hide") is True
+    assert session_bus.open_dbus_connection.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "size",
+    [(1920, 1080), (2560, 1440), (3840, 2160)],
+)
+def test_get_screen_size(size, bus):
+    """When get_screen_size is called then it returns the extension's reply."""
+    bus.send_and_get_reply.return_value = reply(*size)
 
-    assert result == expected_size
+    assert mousegrid_plugin.get_screen_size() == size
 
 
-@patch.object(mousegrid_plugin, "host_run", return_value=Mock(returncode=1, stdout=""))
-def test_get_screen_size_with_failure(mock_host_run):
+@pytest.fixture
+def drm(tmp_path, monkeypatch):
+    """An empty stand-in for /sys/class/drm; tests add connectors' mode lists."""
+    monkeypatch.setattr(mousegrid_plugin, "DRM_DIR", tmp_path)
+    return tmp_path
+
+
+def add_modes(drm, connector, modes):
+    """Give a stand-in DRM connector a sysfs mode list."""
+    (drm / connector).mkdir()
+    (drm / connector / "modes").write_text(modes)
+
+
+def test_get_screen_size_with_failure(bus, drm):
     """When get_screen_size fails then it returns default dimensions."""
+    bus.send_and_get_reply.side_effect = OSError
+
     result = mousegrid_plugin.get_screen_size()
 
     assert result == (1920, 1080)
 
 
-@patch.object(mousegrid_plugin, "host_run")
-def test_get_screen_size_with_fallback_to_drm(mock_host_run):
-    """When get_screen_size fails to parse gdbus but finds drm modes then it parses drm output."""
-    # First call (gdbus) succeeds but has invalid format, second call (drm) succeeds
-    mock_host_run.side_effect = [
-        Mock(returncode=0, stdout="invalid"),
-        Mock(returncode=0, stdout="2560x1440@60\n1920x1080@60\n"),
-    ]
+@pytest.mark.parametrize(
+    ["on_connect", "on_send"],
+    [
+        (None, [reply(message_type=MessageType.error)]),
+        (OSError, None),
+        (KeyError("DBUS_SESSION_BUS_ADDRESS"), None),
+        (AuthenticationError(b"REJECTED EXTERNAL"), None),
+        (TimeoutError, None),
+        (None, TimeoutError),
+        (None, OSError),
+    ],
+)
+def test_get_screen_size_with_fallback_to_drm(on_connect, on_send, bus, drm):
+    """When the extension can't answer then the first connector listing modes is used.
+
+    Pinned for every way the size query can fail (PR #48). A disconnected
+    connector has an empty mode list; the first mode is the preferred one.
+    """
+    session_bus.open_dbus_connection.side_effect = on_connect
+    bus.send_and_get_reply.side_effect = on_send
+    add_modes(drm, "card0-eDP-1", "")
+    add_modes(drm, "card0-DP-1", "2560x1440\n1920x1080\n")
+    add_modes(drm, "card0-HDMI-A-1", "3840x2160\n")
 
     result = mousegrid_plugin.get_screen_size()
 
     assert result == (2560, 1440)
 
 
-@patch.object(mousegrid_plugin, "host_run")
-def test_get_screen_size_drm_fallback_when_gdbus_returncode_nonzero(mock_host_run):
-    """When gdbus fails outright get_screen_size still parses drm output (PR #48)."""
-    mock_host_run.side_effect = [
-        Mock(returncode=1, stdout=""),
-        Mock(returncode=0, stdout="2560x1440@60\n"),
-    ]
+def test_get_screen_size_is_cached_until_ttl(bus, monkeypatch):
+    """When the grid reopens within SCREEN_SIZE_TTL then the size isn't looked up again.
 
-    result = mousegrid_plugin.get_screen_size()
+    Only the plugin's own ``time`` name is replaced, so time.monotonic stays
+    real for the rest of the process.
+    """
+    now = [100.0]
+    monkeypatch.setattr(
+        mousegrid_plugin, "time", SimpleNamespace(monotonic=lambda: now[0])
+    )
+    bus.send_and_get_reply.side_effect = [reply(1920, 1080), reply(2560, 1440)]
 
-    assert result == (2560, 1440)
+    assert mousegrid_plugin.get_screen_size() == (1920, 1080)
+    now[0] = 129.0
+    assert mousegrid_plugin.get_screen_size() == (1920, 1080)
+    now[0] = 130.0
+    assert mousegrid_plugin.get_screen_size() == (2560, 1440)
+    assert bus.send_and_get_reply.call_count == 2
+
+
+def test_get_screen_size_does_not_cache_the_default(bus, drm):
+    """When the lookup fails then the next call asks again instead of keeping 1920x1080."""
+    bus.send_and_get_reply.side_effect = [OSError, reply(2560, 1440)]
+
+    assert mousegrid_plugin.get_screen_size() == (1920, 1080)
+    assert mousegrid_plugin.get_screen_size() == (2560, 1440)
 
 
 @pytest.mark.parametrize(
@@ -164,6 +242,9 @@ def test_get_screen_size_drm_fallback_when_gdbus_returncode_nonzero(mock_host_ru
         ("tree for five", [3, 4, 5]),
         ("won tu free", [1, 2, 3]),
         ("ate nein", [8, 9]),
+        # "to" is also an alternative; "too" must still match as a whole word.
+        ("too fore", [2, 4]),
+        ("tooth forest", []),
         ("no numbers", []),
         ("0", []),
         ("zero", []),
@@ -368,17 +449,33 @@ def test_update_grid_without_grid_active(mock_dbus_call):
     assert not mock_dbus_call.called
 
 
-@patch.object(mousegrid_plugin, "update_grid", return_value=True)
-def test_process_zones(mock_update_grid):
-    """When process_zones is called with multiple zones then it updates grid for each zone."""
-    zones = [3, 7, 5]
+@patch.object(mousegrid_plugin, "dbus_call", return_value=True)
+def test_process_zones(mock_dbus_call):
+    """When process_zones is given a chain then it zooms through all of it and redraws once."""
+    mousegrid_plugin.grid_active = True
+    mousegrid_plugin.grid_bounds = (0, 0, 1920, 1080)
+    mousegrid_plugin.screen_size = (1920, 1080)
 
-    mousegrid_plugin.process_zones(zones)
+    mousegrid_plugin.process_zones([3, 7, 5])
 
-    assert mock_update_grid.call_count == 3
-    assert mock_update_grid.call_args_list[0].args == (3,)
-    assert mock_update_grid.call_args_list[1].args == (7,)
-    assert mock_update_grid.call_args_list[2].args == (5,)
+    # 3: (1280, 0, 640, 360) -> 7: (1280, 240, 213, 120) -> 5: (1351, 280, 71, 40)
+    assert mousegrid_plugin.grid_bounds == (1351, 280, 71, 40)
+    assert mock_dbus_call.call_count == 1
+    assert mock_dbus_call.call_args.args == ("Update", 1351, 280, 71, 40)
+
+
+@pytest.mark.parametrize("grid_active", [True, False])
+@patch.object(mousegrid_plugin, "dbus_call", return_value=True)
+def test_process_zones_without_a_valid_zone(mock_dbus_call, grid_active):
+    """When no zone in the chain applies then the grid isn't redrawn."""
+    mousegrid_plugin.grid_active = grid_active
+    mousegrid_plugin.grid_bounds = (0, 0, 1920, 1080)
+    mousegrid_plugin.screen_size = (1920, 1080)
+
+    mousegrid_plugin.process_zones([0])
+
+    assert mousegrid_plugin.grid_bounds == (0, 0, 1920, 1080)
+    assert not mock_dbus_call.called
 
 
 @pytest.mark.parametrize(
@@ -490,6 +587,26 @@ def test_nudge_grid_clamping_at_edges(mock_dbus_call):
     assert mousegrid_plugin.grid_bounds == (0, 10, 300, 400)
 
 
+@pytest.mark.parametrize(
+    ["direction", "bounds"],
+    [
+        ("up", (10, 0, 300, 400)),
+        ("left", (0, 10, 300, 400)),
+        ("down", (10, 680, 300, 400)),
+        ("right", (1620, 10, 300, 400)),
+    ],
+)
+@patch.object(mousegrid_plugin, "dbus_call", return_value=True)
+def test_nudge_grid_already_at_edge(mock_dbus_call, direction, bounds):
+    """When a nudge can't move the cell any further then the grid isn't redrawn."""
+    mousegrid_plugin.grid_bounds = bounds
+    mousegrid_plugin.screen_size = (1920, 1080)
+
+    assert mousegrid_plugin.nudge_grid(direction, 1) is True
+    assert mousegrid_plugin.grid_bounds == bounds
+    assert not mock_dbus_call.called
+
+
 @patch.object(mousegrid_plugin, "dbus_call", return_value=True)
 def test_nudge_grid_without_bounds(mock_dbus_call):
     """When nudge_grid is called without grid_bounds then it returns False."""
@@ -570,13 +687,13 @@ def test_end_drag_without_bounds(mock_dbus_call):
 
 
 @pytest.mark.parametrize(
-    ["command"],
+    "command",
     [
-        ["grid"],
-        ["mouse"],
-        ["pointer"],
-        ["grit"],
-        ["grip"],
+        "grid",
+        "mouse",
+        "pointer",
+        "grit",
+        "grip",
     ],
 )
 @patch.object(mousegrid_plugin, "listen_for_grid_commands")
@@ -591,11 +708,11 @@ def test_handle_show_grid_commands(mock_show_grid, mock_listen, command, mock_co
 
 
 @pytest.mark.parametrize(
-    ["command"],
+    "command",
     [
-        ["upgrade"],
-        ["degrade the image"],
-        ["congratulations"],
+        "upgrade",
+        "degrade the image",
+        "congratulations",
     ],
 )
 @patch.object(mousegrid_plugin, "listen_for_grid_commands")
@@ -626,10 +743,10 @@ def test_handle_again_ignores_words_containing_a_trigger(
 
 
 @pytest.mark.parametrize(
-    ["command"],
+    "command",
     [
-        ["grid close"],
-        ["grid hide"],
+        "grid close",
+        "grid hide",
     ],
 )
 @patch.object(mousegrid_plugin, "listen_for_grid_commands")
@@ -837,16 +954,16 @@ def test_listen_for_grid_commands_drag(mock_end_drag, mock_core_factory):
 
 
 @pytest.mark.parametrize(
-    ["exit_command"],
+    "exit_command",
     [
-        ["close"],
-        ["cancel"],
-        ["escape"],
-        ["exit"],
-        ["hide"],
-        ["stop"],
-        ["done"],
-        ["quit"],
+        "close",
+        "cancel",
+        "escape",
+        "exit",
+        "hide",
+        "stop",
+        "done",
+        "quit",
     ],
 )
 def test_listen_for_grid_commands_exit_commands(exit_command, mock_core_factory):